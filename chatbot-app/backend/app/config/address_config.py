@@ -425,7 +425,11 @@ PROMPT_CONFIG = {
     # Parallel processing settings
     "enable_parallel_batching": True,  # Process multiple batches concurrently
     "max_parallel_batches": 5,  # Maximum number of batches to process simultaneously (3-5 recommended)
+    "max_parallel_files": 2,  # Inbound files processed at once in --batch-process mode
     "parallel_timeout": 300,  # Timeout in seconds for ALL parallel batches (5 minutes for large datasets)
+    # Deployment quota; when set, AI calls are paced to stay under it (0 = no pacing, only 429 Retry-After backoff)
+    "requests_per_minute": 0,
+    "tokens_per_minute": 0,
     # Debugging and logging
     "debug_mode": False,  # Set to True for verbose logging (all API requests/responses)
     "show_progress": True  # Show batch progress messages
@@ -1,15 +1,22 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 import importlib
 import time
+import threading
 try:
     chardet = importlib.import_module("chardet")
 except Exception:  # pragma: no cover
     chardet = None
-import pandas as pd
+try:
+    orjson = importlib.import_module("orjson")
+except Exception:  # pragma: no cover
+    orjson = None
 from dotenv import load_dotenv
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 # Import address configuration
 try:
@@ -46,6 +53,81 @@ except Exception as e:
 # Load environment variables
 load_dotenv()
 
+# One pooled session for the token and chat-completion endpoints, so parallel batches reuse
+# keep-alive TLS connections instead of handshaking on every call. Retries stay in
+# connect_wso2's own loop, so the adapter does not retry.
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """Return the shared pooled requests.Session for Azure OpenAI calls, creating it on first use"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _http_session = session
+        return _http_session
+
+class RequestBudget:
+    """
+    Sliding-window limit on AI requests and tokens per minute, shared by every thread
+    
+    acquire() blocks until one more request of the given token cost fits in the last 60 seconds,
+    so parallel batches stay under the deployment quota instead of finding it through 429s.
+    A limit of 0 disables that check; with both at 0 only pause() (429 Retry-After) holds callers back.
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, window: float = 60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._sent = deque()  # (monotonic time, estimated tokens) of requests inside the window
+        self._tokens_in_window = 0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: int):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and self._sent[0][0] <= now - self.window:
+                    self._tokens_in_window -= self._sent.popleft()[1]
+                wait = self._paused_until - now
+                if wait <= 0:
+                    over_requests = self.requests_per_minute and len(self._sent) >= self.requests_per_minute
+                    # A single request larger than the whole token budget is let through on an empty window
+                    over_tokens = self.tokens_per_minute and self._sent and self._tokens_in_window + tokens > self.tokens_per_minute
+                    if not (over_requests or over_tokens):
+                        if self.requests_per_minute or self.tokens_per_minute:
+                            self._sent.append((now, tokens))
+                            self._tokens_in_window += tokens
+                        return
+                    wait = self._sent[0][0] + self.window - now
+            time.sleep(max(wait, 0.01))
+    
+    def pause(self, seconds: float):
+        """Hold back every caller for the given time, e.g. after the service answered 429"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+_request_budget = None
+_request_budget_lock = threading.Lock()
+
+def get_request_budget() -> RequestBudget:
+    """Return the shared RequestBudget, sized from PROMPT_CONFIG on first use"""
+    global _request_budget
+    with _request_budget_lock:
+        if _request_budget is None:
+            config = PROMPT_CONFIG if CONFIG_AVAILABLE else {}
+            _request_budget = RequestBudget(
+                config.get("requests_per_minute", 0),
+                config.get("tokens_per_minute", 0)
+            )
+        return _request_budget
+
 # Token cache - stores token and expiration time
 _token_cache = {
     'token': None,
@@ -80,7 +162,7 @@ def get_access_token():
         print(f"Using client_secret: {client_secret[:4]}...")  # Don't print full secret in logs
         print(f"Auth endpoint: {auth_token_endpoint}")
 
-    response = requests.post(auth_token_endpoint, data={
+    response = get_http_session().post(auth_token_endpoint, data={
         'grant_type': 'client_credentials',
         'client_id': client_id,
         'client_secret': client_secret
@@ -106,30 +188,12 @@ def get_access_token():
     else:
         raise Exception(f'Failed to obtain access token: {response.text}')
 
-def connect_wso2(access_token, user_content: str, system_prompt: str = None, prompt_type: str = "general", max_tokens: int = None):
-    deployment_id = os.getenv("AZURE_OPENAI_DEPLOYMENT_ID", "AOAIsharednonprodgpt35turbo16k")
-    api_version = '2024-02-15-preview'
-    proxy_url = 'https://api-test.cbre.com:443/t/digitaltech_us_edp/cbreopenaiendpoint/1/openai/deployments/{deployment_id}/chat/completions'
-    url_variable = proxy_url.format(deployment_id=deployment_id)
-    url_with_param = f'{url_variable}?api-version={api_version}'
-
-    # Get debug mode from config
-    debug_mode = PROMPT_CONFIG.get("debug_mode", False) if CONFIG_AVAILABLE else False
-    
-    if debug_mode:
-        print(f"OpenAI URL: {url_with_param}")
-
-    if not system_prompt:
-        system_prompt = get_custom_system_prompt(prompt_type)
-
-    # Ensure Unicode-safe content
-    user_content = ensure_unicode_safe_content(user_content)
-    system_prompt = ensure_unicode_safe_content(system_prompt)
-
+def _build_chat_request_body(user_content: str, system_prompt: str, max_tokens: int = None) -> dict:
+    """Chat-completion request body with the sampling settings from the prompt configuration"""
     # Get prompt configuration from config file
     config = get_prompt_config()
 
-    request_body = {
+    return {
         "messages": [
             {
                 "role": "system",
@@ -146,11 +210,35 @@ def connect_wso2(access_token, user_content: str, system_prompt: str = None, pro
         "presence_penalty": config.get("presence_penalty", 0)
     }
 
-    # Check request size to prevent timeouts
+def connect_wso2(access_token, user_content: str, system_prompt: str = None, prompt_type: str = "general", max_tokens: int = None):
+    deployment_id = os.getenv("AZURE_OPENAI_DEPLOYMENT_ID", "AOAIsharednonprodgpt35turbo16k")
+    api_version = '2024-02-15-preview'
+    proxy_url = 'https://api-test.cbre.com:443/t/digitaltech_us_edp/cbreopenaiendpoint/1/openai/deployments/{deployment_id}/chat/completions'
+    url_variable = proxy_url.format(deployment_id=deployment_id)
+    url_with_param = f'{url_variable}?api-version={api_version}'
+
+    # Get debug mode from config
+    debug_mode = PROMPT_CONFIG.get("debug_mode", False) if CONFIG_AVAILABLE else False
+    
+    if debug_mode:
+        print(f"OpenAI URL: {url_with_param}")
+
+    if not system_prompt:
+        system_prompt = get_custom_system_prompt(prompt_type)
+
+    # Ensure Unicode-safe content (system prompts are a handful of fixed strings, prepared once each)
+    user_content = ensure_unicode_safe_content(user_content)
+    system_prompt = _prepared_system_prompt(system_prompt)
+
+    request_body = _build_chat_request_body(user_content, system_prompt, max_tokens)
+
+    # Serialize once; the same bytes are sent on every retry
     request_body_json = json.dumps(request_body, ensure_ascii=False)
-    request_size_kb = len(request_body_json.encode('utf-8')) / 1024
+    request_body_bytes = request_body_json.encode('utf-8')
     
     if debug_mode:
+        # Check request size to prevent timeouts
+        request_size_kb = len(request_body_bytes) / 1024
         print(f"Request size: {request_size_kb:.1f} KB")
         if request_size_kb > 100:  # Warn if request is getting large
             print(f"⚠️ Large request detected ({request_size_kb:.1f} KB) - may timeout")
@@ -161,17 +249,22 @@ def connect_wso2(access_token, user_content: str, system_prompt: str = None, pro
         'Authorization': f'Bearer {access_token}'
     }
 
-    # Retry logic for 503 errors
+    # Retry logic for 503 errors and 429 throttling (callers no longer pause between rows)
     max_retries = 3
     retry_delay = 2  # seconds
     
+    # The service counts the prompt (~4 bytes per token) plus the full max_tokens allowance against the quota
+    estimated_tokens = len(request_body_bytes) // 4 + request_body["max_tokens"]
+    budget = get_request_budget()
+    
     for attempt in range(max_retries):
+        budget.acquire(estimated_tokens)
         try:
             # Add timeout settings to prevent hanging requests
-            response = requests.post(
+            response = get_http_session().post(
                 url_with_param, 
                 headers=headers, 
-                data=json.dumps(request_body, ensure_ascii=False).encode('utf-8'),
+                data=request_body_bytes,
                 timeout=(30, 120)  # (connection timeout, read timeout) in seconds
             )
             
@@ -187,6 +280,14 @@ def connect_wso2(access_token, user_content: str, system_prompt: str = None, pro
                 print(f"⚠️ 503 Service Unavailable - retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})...")
                 time.sleep(wait_time)
                 continue
+            elif response.status_code == 429 and attempt < max_retries - 1:
+                # Rate limited - wait as long as the service asks, if it says
+                retry_after = response.headers.get('Retry-After', '')
+                wait_time = float(retry_after) if retry_after.replace('.', '', 1).isdigit() else retry_delay * (attempt + 1)
+                print(f"⚠️ 429 Too Many Requests - retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})...")
+                budget.pause(wait_time)  # Other threads would hit the same limit, so they wait too
+                time.sleep(wait_time)
+                continue
             else:
                 raise RuntimeError(f"OpenAI API error: {response.status_code} {response.text}")
                 
@@ -278,6 +379,8 @@ def read_csv_with_encoding_detection(file_path: str):
     Raises:
         Exception: If file cannot be read with any encoding
     """
+    import pandas as pd  # Imported here so API-only callers don't pay pandas' import cost
+    
     print(f"📄 Reading CSV file: {file_path}")
     
     # First, detect the encoding
@@ -339,14 +442,16 @@ def read_csv_with_encoding_detection(file_path: str):
             continue
         try:
             print(f"🔄 Trying encoding: {encoding}")
-            df = pd.read_csv(
-                file_path,
-                encoding=encoding,
-                sep=None,            # auto-detect delimiter
-                engine='python',     # enables sep=None and robust parsing
-                on_bad_lines='skip', # skip malformed rows instead of failing
-                dtype=str            # keep values as strings to avoid inference issues
-            )
+            df = _read_csv_with_arrow(file_path, encoding)
+            if df is None:
+                df = pd.read_csv(
+                    file_path,
+                    encoding=encoding,
+                    sep=None,            # auto-detect delimiter
+                    engine='python',     # enables sep=None and robust parsing
+                    on_bad_lines='skip', # skip malformed rows instead of failing
+                    dtype=str            # keep values as strings to avoid inference issues
+                )
             print(f"✅ Successfully read file with {encoding} encoding")
             print(f"📊 Loaded {len(df)} rows with {len(df.columns)} columns")
             return df
@@ -375,6 +480,60 @@ def read_csv_with_encoding_detection(file_path: str):
     except Exception as e:
         raise Exception(f"❌ Could not read CSV file with any encoding: {str(e)}")
 
+# Cell values pandas reads as missing by default; the Arrow fast path treats the same strings as null
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+def _read_csv_with_arrow(file_path: str, encoding: str, delimiter: str = None):
+    """
+    Fast path for read_csv_with_encoding_detection: sniff the delimiter from the first line (as the
+    python engine's sep=None does, unless one is given) and parse every column as text with the
+    multi-threaded Arrow reader
+    
+    Returns None when that is not possible (pyarrow missing, undetectable delimiter, a header pandas
+    would rename, or a file the stricter Arrow parser rejects, such as one with malformed rows) so the
+    caller falls back to the python engine; decoding errors propagate so the caller moves on to the
+    next encoding.
+    """
+    import csv
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+    
+    with open(file_path, 'r', encoding=encoding, newline='') as f:
+        first_line = f.readline().lstrip('\ufeff')
+    if delimiter is None:
+        try:
+            delimiter = csv.Sniffer().sniff(first_line).delimiter
+        except csv.Error:
+            return None
+    header = next(csv.reader([first_line], delimiter=delimiter), [])
+    if not header or '' in header or len(set(header)) != len(header):
+        return None  # pandas would name these 'Unnamed: n' / 'col.1'
+    
+    try:
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(encoding=encoding),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                null_values=CSV_NA_VALUES,
+                strings_can_be_null=True
+            )
+        )
+    except (UnicodeDecodeError, UnicodeError):
+        raise
+    except Exception:
+        return None
+    
+    df = table.to_pandas()
+    return df.where(df.notna())  # None -> NaN, as the python engine returns
+
 def ensure_unicode_safe_content(content: str) -> str:
     """
     Ensure content is Unicode-safe for API transmission
@@ -405,6 +564,24 @@ def ensure_unicode_safe_content(content: str) -> str:
         # Replace problematic characters with safe alternatives
         return content.encode('utf-8', errors='replace').decode('utf-8')
 
+def _loads_model_json(content: str):
+    """Parse JSON returned by the model, using orjson when it is installed (raises json.JSONDecodeError either way)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _clear_null_strings(result: dict) -> dict:
+    """Turn the model's quoted placeholders ('null', 'None', '') into None so callers can just test truthiness"""
+    for key, value in result.items():
+        if isinstance(value, str) and value.strip().lower() in ('null', 'none', ''):
+            result[key] = None
+    return result
+
+@lru_cache(maxsize=16)
+def _prepared_system_prompt(system_prompt: str) -> str:
+    """ensure_unicode_safe_content for a system prompt, memoized since the prompts are fixed strings"""
+    return ensure_unicode_safe_content(system_prompt)
+
 def standardize_address(raw_address: str, target_country: str = None):
     """
     Convenience function specifically for address standardization with optional country-specific formatting
@@ -453,8 +630,9 @@ def standardize_address(raw_address: str, target_country: str = None):
             
             # Try to parse as JSON
             try:
-                import json
-                result = json.loads(content)
+                result = _loads_model_json(content)
+                if isinstance(result, dict):
+                    _clear_null_strings(result)
                 
                 # If target country was specified, ensure country_code is set
                 if target_country and 'country_code' not in result:
@@ -467,7 +645,7 @@ def standardize_address(raw_address: str, target_country: str = None):
                         # Create formatted address using country-specific pattern
                         formatted_parts = {}
                         for key, value in result.items():
-                            if value and value != 'null':
+                            if value:
                                 formatted_parts[key] = str(value)
                             else:
                                 formatted_parts[key] = ''
@@ -715,6 +893,133 @@ def standardize_multiple_addresses(address_list: list, target_country: str = Non
     
     return results_copy
 
+def _build_batch_request(address_list: list, target_country: str = None):
+    """
+    Build the user content, system prompt and max_tokens for one batch standardization request
+    
+    Returns:
+        tuple: (user_content, system_prompt, max_tokens)
+    """
+    # Prepare batch content with Unicode-safe processing
+    numbered_addresses = []
+    for i, address in enumerate(address_list):
+        # Ensure each address is Unicode-safe
+        safe_address = ensure_unicode_safe_content(str(address))
+        numbered_addresses.append(f"{i}: {safe_address}")
+    
+    batch_content = "\n".join(numbered_addresses)
+    
+    # Add country context if provided
+    if target_country and CONFIG_AVAILABLE:
+        country_instruction = get_country_specific_prompt(target_country)
+        enhanced_content = f"{country_instruction}\n\nAddresses to standardize:\n{batch_content}"
+    else:
+        enhanced_content = batch_content
+    
+    # Get batch prompt
+    if CONFIG_AVAILABLE:
+        system_prompt = BATCH_ADDRESS_STANDARDIZATION_PROMPT
+    else:
+        system_prompt = get_custom_system_prompt("batch_address_standardization")
+    
+    # Calculate dynamic max_tokens based on batch size
+    # Each address needs ~250 tokens, add 500 buffer for JSON structure
+    tokens_per_address = 300
+    dynamic_max_tokens = len(address_list) * tokens_per_address + 500
+    
+    # Get debug mode from config
+    debug_mode = PROMPT_CONFIG.get("debug_mode", False) if CONFIG_AVAILABLE else False
+    
+    if debug_mode:
+        print(f"   Calculated max_tokens: {dynamic_max_tokens} ({len(address_list)} addresses × {tokens_per_address} + 500 buffer)")
+    
+    return enhanced_content, system_prompt, dynamic_max_tokens
+
+def _parse_batch_response_content(content: str, address_list: list, target_country: str = None, batch_offset: int = 0):
+    """
+    Parse the model's reply to a batch standardization request into one result dict per address
+    
+    Raises:
+        ValueError: If the reply cannot be parsed as a JSON array of results
+    """
+    # Clean the content - remove markdown code blocks if present
+    content = content.strip()
+    if content.startswith('```json'):
+        content = content[7:]
+    if content.startswith('```'):
+        content = content[3:]
+    if content.endswith('```'):
+        content = content[:-3]
+    content = content.strip()
+    
+    # Parse as JSON array with robust error handling
+    try:
+        import re
+        
+        # Try multiple JSON parsing strategies
+        batch_results = None
+        
+        # Strategy 1: Direct JSON parsing
+        try:
+            batch_results = _loads_model_json(content)
+        except json.JSONDecodeError:
+            # Strategy 2: Fix common JSON issues
+            try:
+                # Fix unescaped quotes in strings
+                fixed_content = _fix_json_quotes(content)
+                batch_results = json.loads(fixed_content)
+            except json.JSONDecodeError:
+                # Strategy 3: Extract JSON from partial response
+                try:
+                    json_match = re.search(r'\[.*\]', content, re.DOTALL)
+                    if json_match:
+                        json_content = json_match.group(0)
+                        # Try to fix incomplete JSON
+                        json_content = _fix_incomplete_json(json_content)
+                        batch_results = json.loads(json_content)
+                except (json.JSONDecodeError, AttributeError):
+                    # Strategy 4: Try to parse individual objects
+                    batch_results = _parse_individual_json_objects(content)
+        
+        if batch_results is None:
+            raise ValueError("Could not parse JSON response with any strategy")
+        
+        # Ensure it's a list
+        if not isinstance(batch_results, list):
+            if isinstance(batch_results, dict):
+                batch_results = [batch_results]
+            else:
+                raise ValueError("Expected JSON array from batch processing")
+        
+        # Adjust input_index with batch_offset and add missing fields
+        processed_results = []
+        for result in batch_results:
+            if isinstance(result, dict):
+                _clear_null_strings(result)
+                
+                # Adjust the input_index with batch offset
+                original_index = result.get('input_index', 0)
+                result['input_index'] = batch_offset + original_index
+                
+                # Add original address for reference
+                if original_index < len(address_list):
+                    result['original_address'] = ensure_unicode_safe_content(str(address_list[original_index]))
+                
+                # Apply country-specific formatting if needed
+                if target_country and target_country.upper() in COUNTRY_FORMATS and CONFIG_AVAILABLE:
+                    _apply_country_formatting(result, target_country)
+                
+                processed_results.append(result)
+        
+        return processed_results
+        
+    except Exception as e:
+        # Log the problematic content for debugging
+        debug_mode = PROMPT_CONFIG.get("debug_mode", False) if CONFIG_AVAILABLE else False
+        if debug_mode:
+            print(f"DEBUG: Failed to parse JSON content: {content[:500]}...")
+        raise ValueError(f"Failed to parse batch response as JSON: {str(e)}")
+
 def _process_address_batch(address_list: list, target_country: str = None, batch_offset: int = 0):
     """
     Process a batch of addresses in a single API call
@@ -731,38 +1036,7 @@ def _process_address_batch(address_list: list, target_country: str = None, batch
         # Get access token
         access_token = get_access_token()
         
-        # Prepare batch content with Unicode-safe processing
-        numbered_addresses = []
-        for i, address in enumerate(address_list):
-            # Ensure each address is Unicode-safe
-            safe_address = ensure_unicode_safe_content(str(address))
-            numbered_addresses.append(f"{i}: {safe_address}")
-        
-        batch_content = "\n".join(numbered_addresses)
-        
-        # Add country context if provided
-        if target_country and CONFIG_AVAILABLE:
-            country_instruction = get_country_specific_prompt(target_country)
-            enhanced_content = f"{country_instruction}\n\nAddresses to standardize:\n{batch_content}"
-        else:
-            enhanced_content = batch_content
-        
-        # Get batch prompt
-        if CONFIG_AVAILABLE:
-            system_prompt = BATCH_ADDRESS_STANDARDIZATION_PROMPT
-        else:
-            system_prompt = get_custom_system_prompt("batch_address_standardization")
-        
-        # Calculate dynamic max_tokens based on batch size
-        # Each address needs ~250 tokens, add 500 buffer for JSON structure
-        tokens_per_address = 300
-        dynamic_max_tokens = len(address_list) * tokens_per_address + 500
-        
-        # Get debug mode from config
-        debug_mode = PROMPT_CONFIG.get("debug_mode", False) if CONFIG_AVAILABLE else False
-        
-        if debug_mode:
-            print(f"   Calculated max_tokens: {dynamic_max_tokens} ({len(address_list)} addresses × {tokens_per_address} + 500 buffer)")
+        enhanced_content, system_prompt, dynamic_max_tokens = _build_batch_request(address_list, target_country)
         
         # Call OpenAI with batch prompt
         response = connect_wso2(
@@ -775,96 +1049,92 @@ def _process_address_batch(address_list: list, target_country: str = None, batch
         # Extract and parse the batch response
         if 'choices' in response and len(response['choices']) > 0:
             content = response['choices'][0]['message']['content']
-            
-            # Clean the content - remove markdown code blocks if present
-            content = content.strip()
-            if content.startswith('```json'):
-                content = content[7:]
-            if content.startswith('```'):
-                content = content[3:]
-            if content.endswith('```'):
-                content = content[:-3]
-            content = content.strip()
-            
-            # Parse as JSON array with robust error handling
-            try:
-                import json
-                import re
-                
-                # Try multiple JSON parsing strategies
-                batch_results = None
-                
-                # Strategy 1: Direct JSON parsing
-                try:
-                    batch_results = json.loads(content)
-                except json.JSONDecodeError:
-                    # Strategy 2: Fix common JSON issues
-                    try:
-                        # Fix unescaped quotes in strings
-                        fixed_content = _fix_json_quotes(content)
-                        batch_results = json.loads(fixed_content)
-                    except json.JSONDecodeError:
-                        # Strategy 3: Extract JSON from partial response
-                        try:
-                            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-                            if json_match:
-                                json_content = json_match.group(0)
-                                # Try to fix incomplete JSON
-                                json_content = _fix_incomplete_json(json_content)
-                                batch_results = json.loads(json_content)
-                        except (json.JSONDecodeError, AttributeError):
-                            # Strategy 4: Try to parse individual objects
-                            batch_results = _parse_individual_json_objects(content)
-                
-                if batch_results is None:
-                    raise ValueError("Could not parse JSON response with any strategy")
-                
-                # Ensure it's a list
-                if not isinstance(batch_results, list):
-                    if isinstance(batch_results, dict):
-                        batch_results = [batch_results]
-                    else:
-                        raise ValueError("Expected JSON array from batch processing")
-                
-                # Adjust input_index with batch_offset and add missing fields
-                processed_results = []
-                for result in batch_results:
-                    if isinstance(result, dict):
-                        # Adjust the input_index with batch offset
-                        original_index = result.get('input_index', 0)
-                        result['input_index'] = batch_offset + original_index
-                        
-                        # Add original address for reference
-                        if original_index < len(address_list):
-                            result['original_address'] = ensure_unicode_safe_content(str(address_list[original_index]))
-                        
-                        # Apply country-specific formatting if needed
-                        if target_country and target_country.upper() in COUNTRY_FORMATS and CONFIG_AVAILABLE:
-                            _apply_country_formatting(result, target_country)
-                        
-                        processed_results.append(result)
-                
-                return processed_results
-                
-            except Exception as e:
-                # Log the problematic content for debugging
-                debug_mode = PROMPT_CONFIG.get("debug_mode", False) if CONFIG_AVAILABLE else False
-                if debug_mode:
-                    print(f"DEBUG: Failed to parse JSON content: {content[:500]}...")
-                raise ValueError(f"Failed to parse batch response as JSON: {str(e)}")
+            return _parse_batch_response_content(content, address_list, target_country, batch_offset)
         else:
             raise ValueError("No response received from OpenAI for batch")
             
     except Exception as e:
         raise Exception(f"Batch processing failed: {str(e)}")
 
+def write_batch_api_requests(address_list: list, output_path: str, target_country: str = None, batch_size: int = None) -> int:
+    """
+    Write an Azure OpenAI Batch API input file (JSONL) for standardizing address_list
+    
+    Each line is one chat-completion request for batch_size addresses (default PROMPT_CONFIG
+    batch_size), built exactly like a live batch call, with custom_id "batch-<offset>" so the
+    results can be matched back by read_batch_api_results.
+    
+    Returns:
+        int: Number of requests written
+    """
+    if batch_size is None:
+        batch_size = PROMPT_CONFIG.get("batch_size", 10) if CONFIG_AVAILABLE else 10
+    deployment_id = os.getenv("AZURE_OPENAI_DEPLOYMENT_ID", "AOAIsharednonprodgpt35turbo16k")
+    
+    request_count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for batch_offset in range(0, len(address_list), batch_size):
+            user_content, system_prompt, max_tokens = _build_batch_request(address_list[batch_offset:batch_offset + batch_size], target_country)
+            body = _build_chat_request_body(user_content, system_prompt, max_tokens)
+            body["model"] = deployment_id
+            line = {"custom_id": f"batch-{batch_offset}", "method": "POST", "url": "/chat/completions", "body": body}
+            f.write(json.dumps(line, ensure_ascii=False) + '\n')
+            request_count += 1
+    
+    print(f"📝 Wrote {request_count} Batch API requests for {len(address_list)} addresses to {output_path}")
+    return request_count
+
+def read_batch_api_results(results_path: str, address_list: list, target_country: str = None, batch_size: int = None) -> list:
+    """
+    Read an Azure OpenAI Batch API output file produced from write_batch_api_requests
+    
+    Returns one result per address in input order, in the same shape as standardize_multiple_addresses;
+    addresses whose request failed or is missing get an {'error': ...} result.
+    """
+    if batch_size is None:
+        batch_size = PROMPT_CONFIG.get("batch_size", 10) if CONFIG_AVAILABLE else 10
+    
+    results = [None] * len(address_list)
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = _loads_model_json(line)
+                batch_offset = int(entry.get("custom_id", "").rsplit('-', 1)[-1])
+            except (ValueError, AttributeError) as e:
+                # Its addresses are reported as missing below; the other lines still import
+                print(f"⚠️  Skipping unreadable line in {results_path}: {str(e)}")
+                continue
+            batch_addresses = address_list[batch_offset:batch_offset + batch_size]
+            try:
+                response = entry.get("response") or {}
+                if entry.get("error") or response.get("status_code") != 200:
+                    raise ValueError(f"request failed: {entry.get('error') or response.get('status_code')}")
+                content = response["body"]["choices"][0]["message"]["content"]
+                for result in _parse_batch_response_content(content, batch_addresses, target_country, batch_offset):
+                    if 0 <= result['input_index'] < len(results):
+                        results[result['input_index']] = result
+            except Exception as e:
+                for i, address in enumerate(batch_addresses):
+                    results[batch_offset + i] = {"error": f"Batch API {str(e)}", "original_address": address}
+    
+    missing = 0
+    for i, address in enumerate(address_list):
+        if results[i] is None:
+            results[i] = {"error": "No result in Batch API output", "original_address": address}
+            missing += 1
+    if missing:
+        print(f"⚠️  {missing} addresses had no result in {results_path}")
+    return results
+
 def _apply_country_formatting(result: dict, target_country: str):
     """Apply country-specific formatting to a result"""
     try:
         format_pattern = COUNTRY_FORMATS[target_country.upper()]['format']
         formatted_parts = {}
         for key, value in result.items():
-            if value and value != 'null':
+            if value:
                 formatted_parts[key] = str(value)
             else:
                 formatted_parts[key] = ''
@@ -1003,8 +1273,8 @@ def compare_multiple_addresses(address_pairs: list, batch_size: int = 5):
                                 result['batch_index'] = batch_start + sub_batch_start + i
                                 result['original_address_1'] = addr1
                                 result['original_address_2'] = addr2
-                                result['standardized_address_1'] = std_result1.get('formatted_address', '')
-                                result['standardized_address_2'] = std_result2.get('formatted_address', '')
+                                result['standardized_address_1'] = std_result1.get('formatted_address') or ''
+                                result['standardized_address_2'] = std_result2.get('formatted_address') or ''
                                 all_results.append(result)
                                 
                             except Exception as individual_error:
@@ -1044,8 +1314,8 @@ def compare_multiple_addresses(address_pairs: list, batch_size: int = 5):
                     result['batch_index'] = batch_start + i
                     result['original_address_1'] = addr1
                     result['original_address_2'] = addr2
-                    result['standardized_address_1'] = std_result1.get('formatted_address', '')
-                    result['standardized_address_2'] = std_result2.get('formatted_address', '')
+                    result['standardized_address_1'] = std_result1.get('formatted_address') or ''
+                    result['standardized_address_2'] = std_result2.get('formatted_address') or ''
                     all_results.append(result)
                     
                 except Exception as individual_error:
@@ -9,6 +9,9 @@ backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__
 env_path = os.path.join(backend_dir, '.env')
 load_dotenv(env_path)
 
+# SQL Server accepts at most 2100 parameters per statement, so IN (...) lookups are split into chunks
+MAX_PARAMS_PER_QUERY = 1000
+
 class AzureSQLDatabaseService:
     def __init__(self):
         # Direct configuration for testing
@@ -282,6 +285,9 @@ class AzureSQLDatabaseService:
         """
         Save multiple addresses to database in a single transaction for better performance
         
+        Existing rows are found with chunked IN (...) queries, new rows are written with one
+        fast_executemany INSERT, and their ids are read back by hash.
+        
         Args:
             addresses_data: List of tuples (original_address, standardized_result)
             
@@ -293,83 +299,88 @@ class AzureSQLDatabaseService:
         
         print(f"   💾 Batch saving {len(addresses_data)} addresses to database...")
         
-        address_ids = []
-        addresses_to_insert = []
-        addresses_to_update = []
+        # Only save if successfully processed; the rest keep a None id
+        address_hashes = []
+        for original_address, standardized_result in addresses_data:
+            if (standardized_result.get('status') != 'success' or 
+                standardized_result.get('confidence') == 'low' or
+                'failed' in standardized_result.get('api_source', '') or
+                'fallback' in standardized_result.get('api_source', '')):
+                address_hashes.append(None)
+            else:
+                address_hashes.append(self.generate_address_hash(original_address))
         
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # First pass: check existing addresses and prepare data
-            for original_address, standardized_result in addresses_data:
-                # Only save if successfully processed
-                if (standardized_result.get('status') != 'success' or 
-                    standardized_result.get('confidence') == 'low' or
-                    'failed' in standardized_result.get('api_source', '') or
-                    'fallback' in standardized_result.get('api_source', '')):
-                    address_ids.append(None)
-                    continue
-                
-                address_hash = self.generate_address_hash(original_address)
-                
-                # Check if exists
-                cursor.execute('SELECT id, usage_count FROM standardized_addresses WHERE address_hash = ?', (address_hash,))
-                existing = cursor.fetchone()
-                
-                if existing:
-                    addresses_to_update.append(existing[0])
-                    address_ids.append(existing[0])
-                else:
-                    # Prepare insert data
-                    insert_data = (
-                        address_hash,
-                        original_address,
-                        standardized_result.get('formatted_address', ''),
-                        standardized_result.get('street_number'),
-                        standardized_result.get('street_name'),
-                        standardized_result.get('street_type'),
-                        standardized_result.get('unit_type'),
-                        standardized_result.get('unit_number'),
-                        standardized_result.get('building_name'),
-                        standardized_result.get('floor_number'),
-                        standardized_result.get('city'),
-                        standardized_result.get('state'),
-                        standardized_result.get('county'),
-                        standardized_result.get('postal_code'),
-                        standardized_result.get('country'),
-                        standardized_result.get('country_code'),
-                        standardized_result.get('district'),
-                        standardized_result.get('region'),
-                        standardized_result.get('suburb'),
-                        standardized_result.get('locality'),
-                        standardized_result.get('sublocality'),
-                        standardized_result.get('canton'),
-                        standardized_result.get('prefecture'),
-                        standardized_result.get('oblast'),
-                        standardized_result.get('confidence'),
-                        str(standardized_result.get('issues', [])),
-                        standardized_result.get('api_source'),
-                        float(standardized_result.get('latitude', 0)) if standardized_result.get('latitude') and str(standardized_result.get('latitude')).strip() else None,
-                        float(standardized_result.get('longitude', 0)) if standardized_result.get('longitude') and str(standardized_result.get('longitude')).strip() else None,
-                        standardized_result.get('address_type'),
-                        standardized_result.get('po_box'),
-                        standardized_result.get('delivery_instructions'),
-                        standardized_result.get('mail_route')
-                    )
-                    addresses_to_insert.append(insert_data)
-                    address_ids.append('PENDING')  # Will be replaced with actual ID
+            def ids_by_hash(hashes):
+                hash_to_id = {}
+                for start in range(0, len(hashes), MAX_PARAMS_PER_QUERY):
+                    chunk = hashes[start:start + MAX_PARAMS_PER_QUERY]
+                    placeholders = ', '.join('?' * len(chunk))
+                    cursor.execute(f'SELECT id, address_hash FROM standardized_addresses WHERE address_hash IN ({placeholders})', chunk)
+                    for address_id, address_hash in cursor.fetchall():
+                        hash_to_id[address_hash] = int(address_id)
+                return hash_to_id
+            
+            unique_hashes = list(dict.fromkeys(h for h in address_hashes if h))
+            existing_ids = ids_by_hash(unique_hashes)
             
             # Batch update existing addresses
-            if addresses_to_update:
-                for address_id in addresses_to_update:
-                    cursor.execute('''
-                        UPDATE standardized_addresses 
-                        SET usage_count = usage_count + 1, updated_at = GETDATE()
-                        WHERE id = ?
-                    ''', (address_id,))
-            
-            # Batch insert new addresses
+            addresses_to_update = list(existing_ids.values())
+            for start in range(0, len(addresses_to_update), MAX_PARAMS_PER_QUERY):
+                chunk = addresses_to_update[start:start + MAX_PARAMS_PER_QUERY]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f'''
+                    UPDATE standardized_addresses 
+                    SET usage_count = usage_count + 1, updated_at = GETDATE()
+                    WHERE id IN ({placeholders})
+                ''', chunk)
+            
+            # Batch insert new addresses (an address repeated in the batch is inserted once)
+            addresses_to_insert = []
+            pending_hashes = set()
+            for address_hash, (original_address, standardized_result) in zip(address_hashes, addresses_data):
+                if not address_hash or address_hash in existing_ids or address_hash in pending_hashes:
+                    continue
+                pending_hashes.add(address_hash)
+                addresses_to_insert.append((
+                    address_hash,
+                    original_address,
+                    standardized_result.get('formatted_address', ''),
+                    standardized_result.get('street_number'),
+                    standardized_result.get('street_name'),
+                    standardized_result.get('street_type'),
+                    standardized_result.get('unit_type'),
+                    standardized_result.get('unit_number'),
+                    standardized_result.get('building_name'),
+                    standardized_result.get('floor_number'),
+                    standardized_result.get('city'),
+                    standardized_result.get('state'),
+                    standardized_result.get('county'),
+                    standardized_result.get('postal_code'),
+                    standardized_result.get('country'),
+                    standardized_result.get('country_code'),
+                    standardized_result.get('district'),
+                    standardized_result.get('region'),
+                    standardized_result.get('suburb'),
+                    standardized_result.get('locality'),
+                    standardized_result.get('sublocality'),
+                    standardized_result.get('canton'),
+                    standardized_result.get('prefecture'),
+                    standardized_result.get('oblast'),
+                    standardized_result.get('confidence'),
+                    str(standardized_result.get('issues', [])),
+                    standardized_result.get('api_source'),
+                    float(standardized_result.get('latitude', 0)) if standardized_result.get('latitude') and str(standardized_result.get('latitude')).strip() else None,
+                    float(standardized_result.get('longitude', 0)) if standardized_result.get('longitude') and str(standardized_result.get('longitude')).strip() else None,
+                    standardized_result.get('address_type'),
+                    standardized_result.get('po_box'),
+                    standardized_result.get('delivery_instructions'),
+                    standardized_result.get('mail_route')
+                ))
+            
             if addresses_to_insert:
                 insert_sql = '''
                     INSERT INTO standardized_addresses (
@@ -383,25 +394,16 @@ class AzureSQLDatabaseService:
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 '''
                 
-                # Insert all new addresses
-                inserted_ids = []
-                for insert_data in addresses_to_insert:
-                    cursor.execute(insert_sql, insert_data)
-                    cursor.execute('SELECT @@IDENTITY')
-                    inserted_id = cursor.fetchone()[0]
-                    inserted_ids.append(int(inserted_id))
-                
-                # Replace PENDING with actual IDs
-                insert_index = 0
-                for i, addr_id in enumerate(address_ids):
-                    if addr_id == 'PENDING':
-                        address_ids[i] = inserted_ids[insert_index]
-                        insert_index += 1
+                # Insert all new addresses in one parameter-array round-trip
+                cursor.fast_executemany = True
+                cursor.executemany(insert_sql, addresses_to_insert)
+                existing_ids.update(ids_by_hash([insert_data[0] for insert_data in addresses_to_insert]))
             
             # Single commit for all operations
             conn.commit()
             conn.close()
             
+            address_ids = [existing_ids.get(address_hash) if address_hash else None for address_hash in address_hashes]
             successful_saves = len([aid for aid in address_ids if aid is not None])
             print(f"   ✅ Batch saved {successful_saves}/{len(addresses_data)} addresses to database")
             
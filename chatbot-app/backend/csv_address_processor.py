@@ -4,25 +4,56 @@ Enhanced CSV Address Processor for AddressIQ with Inbound/Outbound Directory Man
 This script processes CSV files containing addresses and standardizes them using Azure OpenAI
 """
 
-import pandas as pd
+from __future__ import annotations
+
 import json
 import os
+import hashlib
 import sys
+import importlib
+import importlib.util
 from typing import List, Dict, Any
 import time
 from datetime import datetime
-import argparse
 from pathlib import Path
 import requests
-from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote, urlparse
 import shutil
+import codecs
+import gzip
 import glob
 import re
+import sqlite3
+import threading
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from functools import lru_cache
+from collections import OrderedDict
+
+def _identity(value):
+    return value
+
+class _LazyModule:
+    """Import a module on first attribute access so CLI paths that never touch it skip its import cost"""
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# pandas is only needed for CSV/database processing; --address, --compare and --test-apis never load it
+pd = _LazyModule('pandas')
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.services.azure_openai import standardize_address, standardize_multiple_addresses, compare_multiple_addresses, read_csv_with_encoding_detection
+from app.services.azure_openai import standardize_address, standardize_multiple_addresses, compare_multiple_addresses, read_csv_with_encoding_detection, _read_csv_with_arrow, write_batch_api_requests, read_batch_api_results
 
 # Import address splitter
 try:
@@ -34,6 +65,189 @@ except ImportError as e:
 
 # Database caching removed - all addresses processed directly via API
 
+# Shared HTTP session for the free geocoding APIs. Processors are created per request by the
+# Flask app, so a process-wide session keeps TCP/TLS connections alive across them.
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """Return the shared pooled requests.Session, creating it on first use"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            # Nominatim's usage policy requires an identifying User-Agent; set once for every request
+            session.headers.update({'User-Agent': 'AddressIQ-Processor/1.0 (contact@addressiq.com)'})
+            atexit.register(session.close)
+            _http_session = session
+        return _http_session
+
+class RateLimiter:
+    """Minimum-interval limiter for one upstream host, safe to share between threads
+    
+    acquire() only sleeps for whatever remains of the interval since the previous call, so callers
+    whose own work already took longer than the interval are not delayed at all.
+    """
+    
+    def __init__(self):
+        self._next_call_ts = 0.0  # Earliest time (time.monotonic) the next call may start
+        self._lock = threading.Lock()
+    
+    def acquire(self, min_interval: float):
+        with self._lock:
+            now = time.monotonic()
+            if self._next_call_ts > now:
+                time.sleep(self._next_call_ts - now)
+            self._next_call_ts = max(now, self._next_call_ts) + min_interval
+
+# One limiter per free API for the whole process, so processors created per Flask request
+# together stay within each API's usage policy
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(api: str) -> RateLimiter:
+    """Return the process-wide rate limiter for the given free API"""
+    with _rate_limiters_lock:
+        if api not in _rate_limiters:
+            _rate_limiters[api] = RateLimiter()
+        return _rate_limiters[api]
+
+# Free-API geocoding results shared by every processor in the process, as a bounded LRU keyed by
+# (api, normalized query) - the Flask app creates a processor per request, so a per-instance cache
+# would start cold on every upload.
+GEOCODE_CACHE_MAX_ENTRIES = 100000
+_geocode_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_geocode_cache_lock = threading.Lock()
+
+# The same results persisted on disk, so repeated or overlapping CSVs skip the free APIs across
+# runs. Set GEOCODE_CACHE_DB_PATH to None to keep the cache in memory only.
+GEOCODE_CACHE_DB_PATH = Path(__file__).parent / 'database' / 'geocache.db'
+GEOCODE_CACHE_TTL_DAYS = 30
+# Bumped whenever _canonical_key changes, so entries stored under the old key scheme are dropped
+GEOCODE_CACHE_KEY_VERSION = 2
+_geocode_db = None
+_geocode_db_lock = threading.Lock()
+
+def get_geocode_db():
+    """Return the shared on-disk geocode cache connection, or None if it is disabled or unavailable
+    
+    Must be called with _geocode_db_lock held; the connection is shared by all threads.
+    """
+    global _geocode_db, GEOCODE_CACHE_DB_PATH
+    if _geocode_db is None and GEOCODE_CACHE_DB_PATH:
+        try:
+            Path(GEOCODE_CACHE_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(GEOCODE_CACHE_DB_PATH), check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS geocode_cache (
+                    provider TEXT NOT NULL,
+                    query_key TEXT NOT NULL,
+                    result_json TEXT NOT NULL,
+                    cached_at INTEGER NOT NULL,
+                    PRIMARY KEY (provider, query_key)
+                )
+            ''')
+            # Expired entries are dropped once per process rather than checked row by row
+            conn.execute('DELETE FROM geocode_cache WHERE cached_at < ?', (int(time.time()) - GEOCODE_CACHE_TTL_DAYS * 86400,))
+            if conn.execute('PRAGMA user_version').fetchone()[0] < GEOCODE_CACHE_KEY_VERSION:
+                conn.execute('DELETE FROM geocode_cache')
+                conn.execute(f'PRAGMA user_version = {int(GEOCODE_CACHE_KEY_VERSION)}')
+            conn.commit()
+            atexit.register(conn.close)
+            _geocode_db = conn
+        except sqlite3.Error as e:
+            print(f"⚠️  Geocode cache database unavailable, using memory cache only: {str(e)}")
+            GEOCODE_CACHE_DB_PATH = None
+    return _geocode_db
+
+# Standardized output columns are named f"{base_col_name}_{suffix}" (from_cache is written separately)
+RESULT_COLUMN_SUFFIXES = (
+    'formatted', 'street_number', 'street_name', 'street_type', 'unit_type', 'unit_number',
+    'city', 'state', 'postal_code', 'country', 'country_code', 'district', 'region', 'suburb',
+    'locality', 'sublocality', 'canton', 'prefecture', 'oblast', 'confidence', 'issues',
+    'status', 'api_source', 'latitude', 'longitude', 'address_id'
+)
+SITE_RESULT_COLUMN_SUFFIXES = (
+    'formatted', 'street_number', 'street_name', 'street_type', 'unit_type', 'unit_number',
+    'city', 'state', 'postal_code', 'country', 'confidence', 'issues', 'status', 'api_source',
+    'latitude', 'longitude', 'address_id'
+)
+
+# Result fields read by parse_standardized_address_to_columns: the street and unit parts are joined
+# into street_address / unit_info, the rest are copied as-is
+STREET_ADDRESS_PARTS = ('street_number', 'street_name', 'street_type')
+UNIT_INFO_PARTS = ('unit_type', 'unit_number')
+DIRECT_ADDRESS_FIELDS = ('city', 'state', 'postal_code')
+
+# Text fields copied from an AI standardization result into our result dicts (see _copy_text_fields):
+# the core components, the regional subdivisions, and extras only the direct single-address input returns
+AI_RESULT_CORE_FIELDS = ('street_number', 'street_name', 'street_type', 'unit_type', 'unit_number', 'city', 'state', 'postal_code', 'country')
+AI_RESULT_TEXT_FIELDS = AI_RESULT_CORE_FIELDS + (
+    'country_code', 'district', 'region', 'suburb', 'locality', 'sublocality', 'canton', 'prefecture', 'oblast'
+)
+AI_RESULT_DETAIL_FIELDS = ('building_name', 'floor_number', 'county', 'address_type', 'po_box', 'delivery_instructions', 'mail_route')
+
+# Result columns are all text; Arrow-backed strings take a fraction of the memory of object columns
+RESULT_COLUMN_DTYPE = 'string[pyarrow]' if importlib.util.find_spec('pyarrow') else object
+
+# CSV inputs larger than this are streamed in AUTO_CHUNK_SIZE-row chunks even without --chunk-size
+AUTO_CHUNK_THRESHOLD_BYTES = 500 * 1024 * 1024
+AUTO_CHUNK_SIZE = 10000
+
+# Common address abbreviations expanded when building geocode cache keys, so spelling variants such
+# as "1600 Amphitheatre Pkwy." and "1600 amphitheatre parkway" share one cached lookup
+# Street types are only expanded in street-type position (after another word, and last in their
+# comma-separated part or followed by a number, a directional or a unit), so "St Louis" (Saint) keeps its "st"
+ADDRESS_KEY_STREET_TYPES = {
+    'st': 'street', 'str': 'street', 'ave': 'avenue', 'av': 'avenue', 'rd': 'road', 'blvd': 'boulevard',
+    'dr': 'drive', 'ln': 'lane', 'ct': 'court', 'pl': 'place', 'sq': 'square', 'ter': 'terrace',
+    'pkwy': 'parkway', 'hwy': 'highway', 'fwy': 'freeway', 'expy': 'expressway', 'cir': 'circle',
+    'trl': 'trail', 'cres': 'crescent'
+}
+# Other abbreviations are expanded anywhere. In both tables a two-letter token followed by a postcode,
+# or standing alone in its part, is taken as a state code (CT, FL, NE, MT) and left as is.
+ADDRESS_KEY_ABBREVIATIONS = {
+    'mt': 'mount', 'ste': 'suite', 'apt': 'apartment', 'fl': 'floor',
+    'n': 'north', 's': 'south', 'e': 'east', 'w': 'west',
+    'ne': 'northeast', 'nw': 'northwest', 'se': 'southeast', 'sw': 'southwest'
+}
+ADDRESS_KEY_PART_SEPARATOR_PATTERN = re.compile(r'[,;\n]')
+ADDRESS_KEY_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+ADDRESS_KEY_POSTCODE_PATTERN = re.compile(r'^(?=.*\d)\w{4,}$')
+
+# Threads for moving/deleting files in the inbound/outbound/archive directories (often network shares,
+# where each filesystem call waits on a round-trip)
+FILE_OPERATION_WORKERS = 16
+
+# File types picked up from the inbound directory (matched case-insensitively)
+INBOUND_FILE_SUFFIXES = ('.csv', '.xlsx')
+
+# Minimum seconds between progress lines while rows are standardized concurrently
+PROGRESS_MIN_INTERVAL = 5.0
+
+# Typical duration of the AI batch call; the Nominatim prefetch that overlaps it is capped to the lookups
+# that fit in this window at Nominatim's rate limit, so it doesn't queue ahead of the real gap-filling lookups
+AI_BATCH_EXPECTED_SECONDS = 10.0
+
+# Fallback for detect_address_columns: any column whose name contains one of these keywords
+ADDRESS_COLUMN_KEYWORD_PATTERN = re.compile(r'address|addr|location')
+
+# Components fill_missing_components_with_free_apis tries to complete from the free geocoding APIs
+KEY_ADDRESS_COMPONENTS = ('street_number', 'street_name', 'city', 'state', 'postal_code')
+
+# What a simplified geocoding query can plausibly return ('coordinates' = latitude/longitude)
+STREET_LEVEL_GEOCODE_YIELDS = frozenset(KEY_ADDRESS_COMPONENTS) | {'coordinates'}
+AREA_LEVEL_GEOCODE_YIELDS = frozenset({'city', 'state', 'postal_code', 'coordinates'})
+
 class CSVAddressProcessor:
     """
     A comprehensive address processor that can:
@@ -54,14 +268,23 @@ class CSVAddressProcessor:
         self.inbound_dir = self.base_directory / "inbound"
         self.outbound_dir = self.base_directory / "outbound"
         self.archive_dir = self.base_directory / "archive"
+        # Part files of chunked runs, kept out of outbound so clean_outbound_directory doesn't remove them
+        self.work_dir = self.base_directory / "work"
         
-        # Create directories if they don't exist
-        self.setup_directories()
-        self.supported_address_columns = [
+        # Per-row progress messages (PROMPT_CONFIG show_progress, toggled by --quiet)
+        try:
+            from app.config.address_config import PROMPT_CONFIG
+            self.show_progress = PROMPT_CONFIG.get("show_progress", True)
+        except ImportError:
+            self.show_progress = True
+        
+        # Create directories if they don't exist (the directory status report is printed by the CLI only)
+        self._ensure_directories()
+        self.supported_address_columns = frozenset({
             'address', 'full_address', 'street_address', 'mailing_address',
             'shipping_address', 'billing_address', 'location', 'addr',
             'property_address', 'site_address', 'address_line_1'
-        ]
+        })
         
         # Define the specific column structure for your site data
         self.site_address_columns = {
@@ -80,6 +303,7 @@ class CSVAddressProcessor:
             'nominatim': {
                 'base_url': 'https://nominatim.openstreetmap.org/search',
                 'rate_limit': 1.0,  # 1 second between requests
+                'hedge_delay': 0.4,  # Launch the next simplified candidate if the previous one is still pending
                 'enabled': True
             },
             'geocodify': {
@@ -88,6 +312,15 @@ class CSVAddressProcessor:
                 'enabled': True
             }
         }
+        # Names of the enabled APIs, kept in step by configure_free_apis so per-row code skips the config lookups
+        self._enabled_providers = tuple(self.free_apis)
+        
+        # A self-hosted Nominatim is not bound by the public usage policy
+        if os.getenv('NOMINATIM_URL'):
+            self.configure_nominatim(os.getenv('NOMINATIM_URL'))
+        
+        # Persistent HTTP session (connection pooling/keep-alive) for the free APIs
+        self._http = get_http_session()
         
         # Database services removed - no caching
         self.db_service = None
@@ -105,49 +338,58 @@ class CSVAddressProcessor:
         else:
             self.address_splitter = None
         
-    def setup_directories(self):
-            self.db_service = None
-            print("⚠️  Running without database caching")
+    def _ensure_directories(self):
+        """Create the inbound, outbound and archive directories if they don't exist"""
+        self.inbound_dir.mkdir(exist_ok=True)
+        self.outbound_dir.mkdir(exist_ok=True)
+        self.archive_dir.mkdir(exist_ok=True)
     
     def setup_directories(self):
         """Create and setup the directory structure"""
         print("📁 Setting up directory structure...")
         
         # Create directories
-        self.inbound_dir.mkdir(exist_ok=True)
-        self.outbound_dir.mkdir(exist_ok=True)
-        self.archive_dir.mkdir(exist_ok=True)
+        self._ensure_directories()
         
         print(f"   📥 Inbound directory: {self.inbound_dir}")
         print(f"   📤 Outbound directory: {self.outbound_dir}")
         print(f"   📦 Archive directory: {self.archive_dir}")
         
         # Show directory status
-        inbound_files = list(self.inbound_dir.glob("*.csv"))
-        outbound_files = list(self.outbound_dir.glob("*.csv"))
+        with os.scandir(self.inbound_dir) as entries:
+            inbound_files = [entry.name for entry in entries if entry.name.endswith('.csv')]
+        with os.scandir(self.outbound_dir) as entries:
+            outbound_count = sum(1 for entry in entries if entry.name.endswith('.csv'))
         
         print(f"   📊 Inbound files: {len(inbound_files)}")
-        print(f"   📊 Outbound files: {len(outbound_files)}")
+        print(f"   📊 Outbound files: {outbound_count}")
         
         if inbound_files:
-            print(f"   📋 Files in inbound: {[f.name for f in inbound_files]}")
+            print(f"   📋 Files in inbound: {inbound_files}")
     
     def clean_outbound_directory(self):
         """Clean the outbound directory before processing"""
         print("🧹 Cleaning outbound directory...")
         
+        def delete(file_path):
+            try:
+                if file_path.is_file():
+                    file_path.unlink()  # Delete file
+                    return f"   🗑️  Deleted: {file_path.name}"
+                elif file_path.is_dir():
+                    shutil.rmtree(file_path)  # Delete directory
+                    return f"   🗑️  Deleted directory: {file_path.name}"
+            except Exception as e:
+                return f"   ⚠️  Could not delete {file_path.name}: {e}"
+            return None
+        
         outbound_files = list(self.outbound_dir.glob("*"))
         if outbound_files:
-            for file_path in outbound_files:
-                try:
-                    if file_path.is_file():
-                        file_path.unlink()  # Delete file
-                        print(f"   🗑️  Deleted: {file_path.name}")
-                    elif file_path.is_dir():
-                        shutil.rmtree(file_path)  # Delete directory
-                        print(f"   🗑️  Deleted directory: {file_path.name}")
-                except Exception as e:
-                    print(f"   ⚠️  Could not delete {file_path.name}: {e}")
+            # Deletions run in parallel; messages are printed afterwards in directory order
+            with ThreadPoolExecutor(max_workers=min(FILE_OPERATION_WORKERS, len(outbound_files))) as executor:
+                for message in executor.map(delete, outbound_files):
+                    if message:
+                        print(message)
             
             print(f"✅ Cleaned {len(outbound_files)} items from outbound directory")
         else:
@@ -158,9 +400,8 @@ class CSVAddressProcessor:
         print("📦 Archiving processed files...")
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        archived_count = 0
         
-        for file_path in processed_files:
+        def archive(file_path):
             try:
                 # Create archive filename with timestamp
                 archive_filename = f"{file_path.stem}_{timestamp}{file_path.suffix}"
@@ -168,11 +409,18 @@ class CSVAddressProcessor:
                 
                 # Move file to archive
                 shutil.move(str(file_path), str(archive_path))
-                print(f"   📦 Archived: {file_path.name} → {archive_filename}")
-                archived_count += 1
+                return True, f"   📦 Archived: {file_path.name} → {archive_filename}"
                 
             except Exception as e:
-                print(f"   ⚠️  Could not archive {file_path.name}: {e}")
+                return False, f"   ⚠️  Could not archive {file_path.name}: {e}"
+        
+        archived_count = 0
+        if processed_files:
+            # Moves run in parallel; messages are printed afterwards in input order
+            with ThreadPoolExecutor(max_workers=min(FILE_OPERATION_WORKERS, len(processed_files))) as executor:
+                for archived, message in executor.map(archive, processed_files):
+                    print(message)
+                    archived_count += archived
         
         print(f"✅ Archived {archived_count} files")
     
@@ -200,8 +448,14 @@ class CSVAddressProcessor:
     
     def get_inbound_files(self) -> List[Path]:
         """Get all CSV files from inbound directory"""
-        csv_files = list(self.inbound_dir.glob("*.csv"))
-        xlsx_files = list(self.inbound_dir.glob("*.xlsx"))  # Also support Excel files
+        csv_files = []
+        xlsx_files = []  # Also support Excel files
+        # One directory pass; DirEntry caches the file type so is_file() needs no extra stat
+        with os.scandir(self.inbound_dir) as entries:
+            for entry in entries:
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in INBOUND_FILE_SUFFIXES and entry.is_file():
+                    (csv_files if suffix == '.csv' else xlsx_files).append(self.inbound_dir / entry.name)
         
         all_files = csv_files + xlsx_files
         
@@ -214,8 +468,14 @@ class CSVAddressProcessor:
         
         return all_files
     
-    def process_all_inbound_files(self, batch_size: int = 10, use_free_apis: bool = False, enable_split: bool = False, use_gpt_split: bool = False):
-        """Process all files in the inbound directory"""
+    def process_all_inbound_files(self, batch_size: int = 10, use_free_apis: bool = False, enable_split: bool = False, use_gpt_split: bool = False,
+                                  chunk_size: int = None):
+        """
+        Process all files in the inbound directory
+        
+        chunk_size streams every CSV in chunks of that many rows (files over AUTO_CHUNK_THRESHOLD_BYTES
+        are streamed either way), so one large inbound file cannot exhaust memory.
+        """
         print("🚀 Starting batch processing of inbound files...")
         print("=" * 60)
         
@@ -229,11 +489,7 @@ class CSVAddressProcessor:
             print("❌ No files to process in inbound directory")
             return
         
-        processed_files = []
-        total_success = 0
-        total_errors = 0
-        
-        for file_path in inbound_files:
+        def process_one(file_path):
             try:
                 print(f"\n🔄 Processing: {file_path.name}")
                 print("-" * 40)
@@ -250,21 +506,34 @@ class CSVAddressProcessor:
                     batch_size=batch_size,
                     use_free_apis=use_free_apis,
                     enable_split=enable_split,
-                    use_gpt_split=use_gpt_split
+                    use_gpt_split=use_gpt_split,
+                    chunk_size=chunk_size
                 )
                 
                 if result_path:
                     print(f"✅ Successfully processed: {file_path.name}")
                     print(f"📤 Output saved to: {output_filename}")
-                    processed_files.append(file_path)
-                    total_success += 1
-                else:
-                    print(f"❌ Failed to process: {file_path.name}")
-                    total_errors += 1
+                    return True
+                print(f"❌ Failed to process: {file_path.name}")
+                return False
                     
             except Exception as e:
                 print(f"❌ Error processing {file_path.name}: {str(e)}")
-                total_errors += 1
+                return False
+        
+        # Files are independent and mostly wait on the network, so a few are processed at once. Threads
+        # (not processes) keep the AI request budget, the free-API rate limiters and the caches shared.
+        try:
+            from app.config.address_config import PROMPT_CONFIG
+            max_parallel_files = PROMPT_CONFIG.get("max_parallel_files", 2)
+        except ImportError:
+            max_parallel_files = 2
+        with ThreadPoolExecutor(max_workers=max(1, min(max_parallel_files, len(inbound_files)))) as executor:
+            outcomes = list(executor.map(process_one, inbound_files))
+        
+        processed_files = [file_path for file_path, ok in zip(inbound_files, outcomes) if ok]
+        total_success = len(processed_files)
+        total_errors = len(inbound_files) - total_success
         
         # Archive processed files
         if processed_files:
@@ -373,34 +642,10 @@ class CSVAddressProcessor:
                     'status': 'success',
                     'original_address': address,
                     'formatted_address': result.get('formatted_address', ''),
-                    'street_number': result.get('street_number', '') or '',
-                    'street_name': result.get('street_name', '') or '',
-                    'street_type': result.get('street_type', '') or '',
-                    'unit_type': result.get('unit_type', '') or '',
-                    'unit_number': result.get('unit_number', '') or '',
-                    'building_name': result.get('building_name', '') or '',
-                    'floor_number': result.get('floor_number', '') or '',
-                    'city': result.get('city', '') or '',
-                    'state': result.get('state', '') or '',
-                    'county': result.get('county', '') or '',
-                    'postal_code': result.get('postal_code', '') or '',
-                    'country': result.get('country', '') or '',
-                    'country_code': result.get('country_code', '') or '',
-                    'district': result.get('district', '') or '',
-                    'region': result.get('region', '') or '',
-                    'suburb': result.get('suburb', '') or '',
-                    'locality': result.get('locality', '') or '',
-                    'sublocality': result.get('sublocality', '') or '',
-                    'canton': result.get('canton', '') or '',
-                    'prefecture': result.get('prefecture', '') or '',
-                    'oblast': result.get('oblast', '') or '',
+                    **self._copy_text_fields(result, AI_RESULT_TEXT_FIELDS + AI_RESULT_DETAIL_FIELDS),
                     'confidence': result.get('confidence', 'medium') or 'medium',
                     'issues': ', '.join(result.get('issues', [])) if result.get('issues') else '',
                     'api_source': 'azure_openai',
-                    'address_type': result.get('address_type', '') or '',
-                    'po_box': result.get('po_box', '') or '',
-                    'delivery_instructions': result.get('delivery_instructions', '') or '',
-                    'mail_route': result.get('mail_route', '') or '',
                     'latitude': '',
                     'longitude': '',
                     'from_cache': False
@@ -445,15 +690,22 @@ class CSVAddressProcessor:
         
         results = []
         
+        # Repeated addresses are sent to the API once and copied to their other positions at the end
+        unique_positions, row_to_unique = self._unique_address_positions(addresses, [country] * len(addresses))
+        unique_addresses = [addresses[i] for i in unique_positions]
+        
         # Process all addresses via API (no caching)
-        print(f"🤖 Processing {len(addresses)} addresses via API")
+        print(f"🤖 Processing {len(unique_addresses)} addresses via API")
+        if len(unique_addresses) < len(addresses):
+            print(f"   ♻️  {len(addresses) - len(unique_addresses)} repeated addresses will reuse earlier results")
         
         # Process addresses in batches
-        if addresses:
+        if unique_addresses:
+            format_output = self._output_formatter(output_format)
             try:
-                ai_results = standardize_multiple_addresses(addresses, use_batch=True)
+                ai_results = standardize_multiple_addresses(unique_addresses, use_batch=True)
                 
-                for i, address in enumerate(addresses):
+                for i, address in enumerate(unique_addresses):
                     if i < len(ai_results):
                         ai_result = ai_results[i]
                         
@@ -463,15 +715,7 @@ class CSVAddressProcessor:
                                 'status': 'success',
                                 'original_address': address,
                                 'formatted_address': ai_result.get('formatted_address', ''),
-                                'street_number': ai_result.get('street_number', '') or '',
-                                'street_name': ai_result.get('street_name', '') or '',
-                                'street_type': ai_result.get('street_type', '') or '',
-                                'unit_type': ai_result.get('unit_type', '') or '',
-                                'unit_number': ai_result.get('unit_number', '') or '',
-                                'city': ai_result.get('city', '') or '',
-                                'state': ai_result.get('state', '') or '',
-                                'postal_code': ai_result.get('postal_code', '') or '',
-                                'country': ai_result.get('country', '') or '',
+                                **self._copy_text_fields(ai_result, AI_RESULT_CORE_FIELDS),
                                 'confidence': ai_result.get('confidence', 'medium') or 'medium',
                                 'issues': ', '.join(ai_result.get('issues', [])) if ai_result.get('issues') else '',
                                 'api_source': 'azure_openai_batch',
@@ -490,23 +734,37 @@ class CSVAddressProcessor:
                             }
                         
                         # Format and add result
-                        results.append(self._format_output(result, output_format))
+                        results.append(format_output(result))
                     else:
                         # Fallback for missing results
-                        results.append(self._format_output({
+                        results.append(format_output({
                             'status': 'failed',
                             'error': 'No result from AI',
                             'original_address': address,
                             'from_cache': False
-                        }, output_format))
+                        }))
                         
             except Exception as e:
                 print(f"❌ Error in batch processing: {e}")
-                # Fallback to individual processing
-                for original_index, address in new_addresses:
-                    results[original_index] = self.process_single_address_input(address, country, output_format)
-        
-        return results
+                # Fallback to individual processing: each address is its own AI round-trip, so they run
+                # concurrently (capped by max_parallel_batches) and map keeps the results in input order
+                try:
+                    from app.config.address_config import PROMPT_CONFIG
+                    max_parallel = PROMPT_CONFIG.get("max_parallel_batches", 5)
+                except ImportError:
+                    max_parallel = 5
+                with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(unique_addresses)))) as executor:
+                    results = list(executor.map(
+                        self.process_single_address_input,
+                        unique_addresses,
+                        [country] * len(unique_addresses),
+                        [output_format] * len(unique_addresses)
+                    ))
+        
+        return [
+            results[u] if unique_positions[u] == i else dict(results[u], original_address=addresses[i])
+            for i, u in enumerate(row_to_unique)
+        ]
 
     def process_database_input(self, 
                               db_type: str,
@@ -648,40 +906,56 @@ class CSVAddressProcessor:
 
     def _format_output(self, result: Dict[str, Any], output_format: str) -> Dict[str, Any]:
         """Format the output based on the requested format"""
+        return self._output_formatter(output_format)(result)
+    
+    @staticmethod
+    def _output_formatter(output_format: str):
+        """Resolve the formatter for output_format once, so per-address loops don't re-check the format"""
         if output_format == 'formatted':
-            return {
-                'original_address': result.get('original_address', ''),
-                'formatted_address': result.get('formatted_address', ''),
-                'confidence': result.get('confidence', ''),
-                'from_cache': result.get('from_cache', False),
-                'status': result.get('status', 'unknown')
-            }
-        elif output_format == 'detailed':
-            return result  # Return full result
-        else:  # json format (default)
-            return result
+            return CSVAddressProcessor._format_formatted
+        # 'detailed' and json (default) return the full result unchanged
+        return _identity
+    
+    @staticmethod
+    def _format_formatted(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Summary fields for the 'formatted' output format"""
+        return {
+            'original_address': result.get('original_address', ''),
+            'formatted_address': result.get('formatted_address', ''),
+            'confidence': result.get('confidence', ''),
+            'from_cache': result.get('from_cache', False),
+            'status': result.get('status', 'unknown')
+        }
         
     def detect_address_columns(self, df: pd.DataFrame) -> List[str]:
         """Automatically detect which columns contain addresses"""
-        address_columns = []
-        
-        # Check for exact matches first
-        for col in df.columns:
-            if col.lower().strip() in self.supported_address_columns:
-                address_columns.append(col)
-        
-        # Check for partial matches if no exact matches found
-        if not address_columns:
-            for col in df.columns:
-                col_lower = col.lower().strip()
-                if any(addr_keyword in col_lower for addr_keyword in ['address', 'addr', 'location']):
-                    address_columns.append(col)
-        
-        return address_columns
+        return list(self._detect_address_columns_cached(tuple(df.columns), self.supported_address_columns))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _detect_address_columns_cached(columns: tuple, supported_address_columns: frozenset) -> tuple:
+        """Detect address columns for a column schema (memoized so same-schema files skip the scan)"""
+        column_index = pd.Index(columns)
+        names = column_index.astype(str).str.lower()
+        
+        # Exact matches win; partial keyword matches are only used when there are none
+        exact_mask = names.str.strip().isin(supported_address_columns)
+        if exact_mask.any():
+            return tuple(column_index[exact_mask])
+        
+        partial_mask = names.str.contains(ADDRESS_COLUMN_KEYWORD_PATTERN, na=False)
+        return tuple(column_index[partial_mask])
     
     def detect_separated_address_components(self, df: pd.DataFrame) -> dict:
         """Detect if address components are in separate columns (like Address Line 1, City, Postcode, etc.)"""
-        columns_lower = {col.lower().replace(' ', '_').replace('-', '_'): col for col in df.columns}
+        # Copy, so callers can't modify the memoized mapping
+        return dict(self._detect_separated_address_components_cached(tuple(df.columns)))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _detect_separated_address_components_cached(columns: tuple) -> dict:
+        """Detect separate address component columns for a column schema (memoized so same-schema files and chunks skip the scan)"""
+        columns_lower = {col.lower().replace(' ', '_').replace('-', '_'): col for col in columns}
         
         # Define patterns for different address components - support multiple address lines
         address_line_patterns = {
@@ -785,26 +1059,7 @@ class CSVAddressProcessor:
     
     def detect_site_address_columns(self, df: pd.DataFrame) -> bool:
         """Check if the DataFrame has the specific site address column structure"""
-        available_columns = [col.lower() for col in df.columns.tolist()]
-        
-        # Check for various site address column patterns
-        address_line_patterns = [
-            'site_address_line1', 'site_address_line2', 'site_address_line3', 'site_address_line4',
-            'site_address_1', 'site_address_2', 'site_address_3', 'site_address_4',
-            'address_line1', 'address_line2', 'address_line3'
-        ]
-        
-        city_patterns = ['site_city', 'city']
-        state_patterns = ['site_state', 'state']
-        postcode_patterns = ['site_postcode', 'postcode', 'postal_code', 'zip_code']
-        country_patterns = ['site_country', 'country']
-        
-        # Check if we have at least one address line and some geographical components
-        has_address_line = any(pattern in available_columns for pattern in address_line_patterns)
-        has_city = any(pattern in available_columns for pattern in city_patterns)
-        has_state = any(pattern in available_columns for pattern in state_patterns)
-        has_postcode = any(pattern in available_columns for pattern in postcode_patterns)
-        has_country = any(pattern in available_columns for pattern in country_patterns)
+        has_address_line, has_city, has_state, has_postcode, has_country = self._site_address_column_flags(tuple(df.columns))
         
         # Count how many geographic components we have
         geo_components = sum([has_city, has_state, has_postcode, has_country])
@@ -820,8 +1075,44 @@ class CSVAddressProcessor:
             print(f"   Geographic components: {geo_components}/4 (need at least 2)")
             return False
     
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _site_address_column_flags(columns: tuple) -> tuple:
+        """(address line, city, state, postcode, country) presence for a column schema, memoized"""
+        available_columns = {col.lower() for col in columns}
+        
+        # Check for various site address column patterns
+        address_line_patterns = {
+            'site_address_line1', 'site_address_line2', 'site_address_line3', 'site_address_line4',
+            'site_address_1', 'site_address_2', 'site_address_3', 'site_address_4',
+            'address_line1', 'address_line2', 'address_line3'
+        }
+        
+        city_patterns = {'site_city', 'city'}
+        state_patterns = {'site_state', 'state'}
+        postcode_patterns = {'site_postcode', 'postcode', 'postal_code', 'zip_code'}
+        country_patterns = {'site_country', 'country'}
+        
+        # Check if we have at least one address line and some geographical components
+        return tuple(
+            not available_columns.isdisjoint(patterns)
+            for patterns in (address_line_patterns, city_patterns, state_patterns, postcode_patterns, country_patterns)
+        )
+    
     def detect_country_column(self, df: pd.DataFrame) -> str:
         """Detect if CSV has a country column"""
+        col = self._detect_country_column_cached(tuple(df.columns))
+        
+        if col:
+            print(f"✅ Detected country column: '{col}'")
+        else:
+            print("ℹ️  No country column detected - will use address-based detection")
+        return col
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _detect_country_column_cached(columns: tuple) -> str:
+        """Detect the country column for a column schema (memoized so same-schema files skip the scan)"""
         country_columns = [
             'country', 'Country', 'COUNTRY', 'nation', 'Nation', 'NATION',
             'country_code', 'Country_Code', 'COUNTRY_CODE', 'country_name',
@@ -829,11 +1120,9 @@ class CSVAddressProcessor:
         ]
         
         for col in country_columns:
-            if col in df.columns:
-                print(f"✅ Detected country column: '{col}'")
+            if col in columns:
                 return col
         
-        print("ℹ️  No country column detected - will use address-based detection")
         return None
     
     def combine_address_columns(self, row: pd.Series, column_names: List[str]) -> str:
@@ -851,72 +1140,122 @@ class CSVAddressProcessor:
         combined_address = ', '.join(address_parts)
         return combined_address if combined_address.strip() else ""
 
+    # Site-format columns combined into one address, in output order. Every address line present is used;
+    # for city/state/postcode/country the first non-empty column of each group wins.
+    SITE_ADDRESS_LINE_COLUMNS = (
+        # Canonical new format
+        'Site_Address_1', 'Site_Address_2', 'Site_Address_3', 'Site_Address_4',
+        # Legacy formats (accepted for backward compatibility)
+        'Site_Address_Line1', 'Site_Address_line2', 'Site_Address_line3', 'Site_Address_Line4',
+        # Generic format
+        'address_line1', 'address_line2', 'address_line3', 'address_line4'
+    )
+    SITE_ADDRESS_FIELD_GROUPS = (
+        ('Site_City', 'City', 'city'),  # Canonical + generic
+        ('Site_State', 'State', 'state'),
+        ('Site_Postcode', 'Site_PostCode', 'PostCode', 'postal_code', 'zip_code'),  # Canonical first
+        ('Site_Country', 'Site_country', 'Country', 'country')
+    )
+    
     def combine_site_address_fields(self, row: pd.Series) -> str:
         """Combine separate site address fields into a single address string"""
-        address_parts = []
-        
-        # Add address lines - handle multiple naming conventions
-        address_line_columns = [
-            # Canonical new format
-            'Site_Address_1', 'Site_Address_2', 'Site_Address_3', 'Site_Address_4',
-            # Legacy formats (accepted for backward compatibility)
-            'Site_Address_Line1', 'Site_Address_line2', 'Site_Address_line3', 'Site_Address_Line4',
-            # Generic format
-            'address_line1', 'address_line2', 'address_line3', 'address_line4'
-        ]
-        
-        for addr_col in address_line_columns:
-            if addr_col in row and pd.notna(row[addr_col]) and str(row[addr_col]).strip() and str(row[addr_col]).strip().upper() != 'NULL':
-                address_parts.append(str(row[addr_col]).strip())
-        
-        # Add city - handle multiple naming conventions
-        city_columns = ['Site_City', 'City', 'city']  # Canonical + generic
-        for city_col in city_columns:
-            if city_col in row and pd.notna(row[city_col]) and str(row[city_col]).strip() and str(row[city_col]).strip().upper() != 'NULL':
-                address_parts.append(str(row[city_col]).strip())
-                break  # Only add one city column
-            
-        # Add state - handle multiple naming conventions
-        state_columns = ['Site_State', 'State', 'state']  # Canonical + generic
-        for state_col in state_columns:
-            if state_col in row and pd.notna(row[state_col]) and str(row[state_col]).strip() and str(row[state_col]).strip().upper() != 'NULL':
-                address_parts.append(str(row[state_col]).strip())
-                break  # Only add one state column
-            
-        # Add postal code - handle multiple naming conventions
-        postcode_columns = ['Site_Postcode', 'Site_PostCode', 'PostCode', 'postal_code', 'zip_code']  # Canonical first
-        for postcode_col in postcode_columns:
-            if postcode_col in row and pd.notna(row[postcode_col]) and str(row[postcode_col]).strip() and str(row[postcode_col]).strip().upper() != 'NULL':
-                address_parts.append(str(row[postcode_col]).strip())
-                break  # Only add one postcode column
-        
-        # Add country - handle multiple naming conventions
-        country_columns = ['Site_Country', 'Site_country', 'Country', 'country']  # Canonical first
-        for country_col in country_columns:
-            if country_col in row and pd.notna(row[country_col]) and str(row[country_col]).strip() and str(row[country_col]).strip().upper() != 'NULL':
-                address_parts.append(str(row[country_col]).strip())
-                break  # Only add one country column
+        def cleaned(col):
+            if col in row and pd.notna(row[col]):
+                value = str(row[col]).strip()
+                if value and value.upper() != 'NULL':
+                    return value
+            return None
+        
+        address_parts = [part for part in map(cleaned, self.SITE_ADDRESS_LINE_COLUMNS) if part]
+        for group in self.SITE_ADDRESS_FIELD_GROUPS:
+            # Only add one column per group
+            part = next((value for value in map(cleaned, group) if value), None)
+            if part:
+                address_parts.append(part)
         
         # Join all parts with commas
-        combined_address = ', '.join(address_parts)
-        return combined_address if combined_address.strip() else ""
+        return ', '.join(address_parts)
+    
+    def combine_site_address_columns(self, df: pd.DataFrame) -> pd.Series:
+        """Column-wise combine_site_address_fields for a whole DataFrame (same result, no per-row apply)"""
+        def cleaned(col):
+            values = df[col]
+            text = values.astype(str).str.strip()
+            return text.where(values.notna() & text.ne('') & text.str.upper().ne('NULL'))
+        
+        parts = [cleaned(col) for col in self.SITE_ADDRESS_LINE_COLUMNS if col in df.columns]
+        for group in self.SITE_ADDRESS_FIELD_GROUPS:
+            present = [col for col in group if col in df.columns]
+            if present:
+                part = cleaned(present[0])
+                for col in present[1:]:
+                    part = part.fillna(cleaned(col))
+                parts.append(part)
+        
+        return self._join_address_parts(parts, df.index)
+    
+    def combine_address_columns_vectorized(self, df: pd.DataFrame, column_names: List[str]) -> pd.Series:
+        """Column-wise combine_address_columns for a whole DataFrame (same result, no per-row apply)"""
+        def cleaned(col):
+            values = df[col]
+            text = values.astype(str).str.strip()
+            return text.where(values.notna() & ~text.str.upper().isin(['NULL', 'N/A', 'NA', '', 'NONE']))
+        
+        return self._join_address_parts([cleaned(col) for col in column_names if col in df.columns], df.index)
+    
+    def combine_separated_address_components_vectorized(self, df: pd.DataFrame, component_mapping: dict) -> pd.Series:
+        """Column-wise combine_separated_address_components for a whole DataFrame (same result, no per-row apply)"""
+        def cleaned(col):
+            text = df[col].astype(str).str.strip()
+            return text.where(text.ne('') & text.str.lower().ne('nan'))
+        
+        keys = [f'address_line_{line_num}' for line_num in range(1, 6)] + ['city', 'state', 'postal_code', 'country']
+        return self._join_address_parts([cleaned(component_mapping[key]) for key in keys if key in component_mapping], df.index)
+    
+    @staticmethod
+    def _join_address_parts(parts: List[pd.Series], index) -> pd.Series:
+        """Join cleaned part columns (missing parts are NaN) row by row with ', '"""
+        if not parts:
+            return pd.Series('', index=index, dtype=object)
+        combined = [', '.join(part for part in row if isinstance(part, str)) for row in zip(*(part.to_numpy(dtype=object) for part in parts))]
+        return pd.Series(combined, index=index, dtype=object)
+    
+    @staticmethod
+    def _valid_address_mask(addresses: List[Any]) -> List[bool]:
+        """Per-address flag: True unless the value is missing or blank
+        
+        Values from a DataFrame can only be pandas missing markers once pandas is loaded, so pd.isna is
+        used then; otherwise None and float NaN are the only missing values and pandas is never imported.
+        """
+        if 'pandas' in sys.modules:
+            is_missing = pd.isna
+        else:
+            is_missing = lambda value: value is None or (isinstance(value, float) and value != value)
+        return [not is_missing(address) and str(address).strip() != '' for address in addresses]
+    
+    @staticmethod
+    def _empty_address_result() -> Dict[str, Any]:
+        """Result for a row with no address to standardize"""
+        return {
+            'status': 'skipped',
+            'reason': 'empty_address',
+            'formatted_address': '',
+            'confidence': 'n/a',
+            'address_id': None,
+            'from_cache': False
+        }
     
     def standardize_single_address(self, address: str, row_index: int, target_country: str = None, use_free_apis: bool = False) -> Dict[str, Any]:
         """Standardize a single address with database caching and error handling"""
         try:
             if pd.isna(address) or not str(address).strip():
-                return {
-                    'status': 'skipped',
-                    'reason': 'empty_address',
-                    'formatted_address': '',
-                    'confidence': 'n/a',
-                    'address_id': None,
-                    'from_cache': False
-                }
+                return self._empty_address_result()
             
             address_str = str(address).strip()
-            print(f"Processing row {row_index + 1}: {address_str[:50]}...")
-            
+            # Per-row messages are gated: rows run concurrently and printing them all is I/O on the hot path
+            show_progress = self.show_progress
+            if show_progress:
+                print(f"Processing row {row_index + 1}: {address_str[:50]}...")
             
             # NEW: Try geocoding FIRST if enabled (for incomplete addresses)
             geocoding_result = None
@@ -934,18 +1273,20 @@ class CSVAddressProcessor:
                 
                 # If address appears incomplete, try geocoding first
                 if not (has_state_abbr and has_zip and has_comma):
-                    print(f"   🌐 Address appears incomplete, trying geocoding first...")
+                    if show_progress:
+                        print(f"   🌐 Address appears incomplete, trying geocoding first...")
                     
-                    if self.free_apis['nominatim']['enabled']:
-                        time.sleep(self.free_apis['nominatim']['rate_limit'])
-                        geocoding_result = self.geocode_with_nominatim(address_str)
+                    if 'nominatim' in self._enabled_providers:
+                        geocoding_result = self._geocode_cached('nominatim', address_str)
                         
                         if geocoding_result.get('success'):
-                            print(f"   ✅ Geocoding found complete address: {geocoding_result.get('formatted_address', '')[:80]}")
+                            if show_progress:
+                                print(f"   ✅ Geocoding found complete address: {geocoding_result.get('formatted_address', '')[:80]}")
                             # Use geocoded address as the enriched input for AI standardization
                             enriched_address = geocoding_result.get('formatted_address', address_str)
                         else:
-                            print(f"   ⚠️  Geocoding failed, will process with AI only")
+                            if show_progress:
+                                print(f"   ⚠️  Geocoding failed, will process with AI only")
                             enriched_address = address_str
                     else:
                         enriched_address = address_str
@@ -955,8 +1296,9 @@ class CSVAddressProcessor:
                 enriched_address = address_str
             
             # Process with AI model (using enriched address if geocoding succeeded)
-            print(f"   🤖 Processing with AI model...")
-            if target_country:
+            if show_progress:
+                print(f"   🤖 Processing with AI model...")
+            if target_country and show_progress:
                 print(f"   🌍 Using country-specific formatting for: {target_country}")
             result = standardize_address(enriched_address if geocoding_result and geocoding_result.get('success') else address_str, target_country)
             
@@ -964,26 +1306,9 @@ class CSVAddressProcessor:
                 enhanced_result = {
                     'status': 'success',
                     'original_address': address_str,
-                    'formatted_address': str(result.get('formatted_address', '')),
-                    'street_number': str(result.get('street_number', '') or ''),
-                    'street_name': str(result.get('street_name', '') or ''),
-                    'street_type': str(result.get('street_type', '') or ''),
-                    'unit_type': str(result.get('unit_type', '') or ''),
-                    'unit_number': str(result.get('unit_number', '') or ''),
-                    'city': str(result.get('city', '') or ''),
-                    'state': str(result.get('state', '') or ''),
-                    'postal_code': str(result.get('postal_code', '') or ''),
-                    'country': str(result.get('country', '') or ''),
-                    'country_code': str(result.get('country_code', '') or ''),
-                    'district': str(result.get('district', '') or ''),
-                    'region': str(result.get('region', '') or ''),
-                    'suburb': str(result.get('suburb', '') or ''),
-                    'locality': str(result.get('locality', '') or ''),
-                    'sublocality': str(result.get('sublocality', '') or ''),
-                    'canton': str(result.get('canton', '') or ''),
-                    'prefecture': str(result.get('prefecture', '') or ''),
-                    'oblast': str(result.get('oblast', '') or ''),
-                    'confidence': result.get('confidence', 'unknown'),
+                    'formatted_address': str(result.get('formatted_address') or ''),
+                    **self._copy_text_fields(result, AI_RESULT_TEXT_FIELDS),
+                    'confidence': result.get('confidence') or 'unknown',
                     'issues': ', '.join(result.get('issues', [])) if result.get('issues') else '',
                     'api_source': 'geocoding_then_azure_openai' if (geocoding_result and geocoding_result.get('success')) else 'azure_openai',
                     'latitude': '',
@@ -1007,7 +1332,8 @@ class CSVAddressProcessor:
             else:
                 # If Azure OpenAI fails, try free APIs as primary source
                 if use_free_apis:
-                    print(f"   ⚠️  Azure OpenAI failed, trying free APIs...")
+                    if show_progress:
+                        print(f"   ⚠️  Azure OpenAI failed, trying free APIs...")
                     fallback_result = {
                         'status': 'partial',
                         'original_address': address_str,
@@ -1033,7 +1359,8 @@ class CSVAddressProcessor:
                     
                     # Do NOT save failed attempts to database - let them be processed fresh each time
                     enhanced_fallback['address_id'] = None
-                    print(f"   ⚠️  Not saving fallback data to database - will retry OpenAI next time")
+                    if show_progress:
+                        print(f"   ⚠️  Not saving fallback data to database - will retry OpenAI next time")
                     
                     return enhanced_fallback
                 
@@ -1059,6 +1386,30 @@ class CSVAddressProcessor:
                 'from_cache': False
             }
     
+    @staticmethod
+    @lru_cache(maxsize=50000)
+    def _norm(address: str) -> str:
+        """Normalize an address string for use as a cache key (case and whitespace insensitive)"""
+        return re.sub(r'\s+', ' ', address.strip().lower())
+    
+    @staticmethod
+    def _canonical_key(address: str) -> str:
+        """Looser cache key than _norm: punctuation dropped and common abbreviations expanded where unambiguous"""
+        key_words = []
+        for part in ADDRESS_KEY_PART_SEPARATOR_PATTERN.split(address.lower()):
+            words = ADDRESS_KEY_PUNCTUATION_PATTERN.sub(' ', part).split()
+            for j, word in enumerate(words):
+                next_word = words[j + 1] if j + 1 < len(words) else None
+                if len(word) == 2 and (len(words) == 1 or (next_word and ADDRESS_KEY_POSTCODE_PATTERN.match(next_word))):
+                    pass  # State code position
+                elif word in ADDRESS_KEY_STREET_TYPES:
+                    if j > 0 and (next_word is None or next_word[0].isdigit() or next_word in ADDRESS_KEY_ABBREVIATIONS):
+                        word = ADDRESS_KEY_STREET_TYPES[word]
+                else:
+                    word = ADDRESS_KEY_ABBREVIATIONS.get(word, word)
+                key_words.append(word)
+        return ' '.join(key_words)
+    
     def standardize_addresses_batch(self, address_batch: List[str], start_index: int, target_country: str = None, use_free_apis: bool = False) -> List[Dict[str, Any]]:
         """
         Standardize a batch of addresses efficiently using batch API calls
@@ -1074,33 +1425,44 @@ class CSVAddressProcessor:
         """
         print(f"🚀 Processing batch of {len(address_batch)} addresses...")
         
-        # Separate addresses into cached and non-cached
-        cached_results = {}
+        # One result slot per input address; skipped, AI and repeated addresses fill their slot directly
+        pending: List[Dict[str, Any]] = [None] * len(address_batch)
         addresses_to_process = []
-        addresses_to_process_mapping = {}  # Maps batch index to original index
-        
-        # Process all addresses (no caching)
-        for i, address in enumerate(address_batch):
-            original_index = start_index + i
-            
-            if pd.isna(address) or not str(address).strip():
-                cached_results[original_index] = {
-                    'status': 'skipped',
-                    'reason': 'empty_address',
-                    'formatted_address': '',
-                    'confidence': 'n/a',
-                    'address_id': None,
-                    'from_cache': False,
-                    'input_index': i
-                }
+        ai_slot = []  # Maps batch index to slot in address_batch
+        normalized_to_batch_index = {}  # Maps normalized address to batch index of its first occurrence
+        duplicate_slots = []  # (slot, batch index of first occurrence) for repeated addresses
+        
+        # Normalize each address once and reuse the AI result for repeated addresses
+        for i, (address, is_valid) in enumerate(zip(address_batch, self._valid_address_mask(address_batch))):
+            if not is_valid:
+                pending[i] = dict(self._empty_address_result(), input_index=i)
                 continue
             
             address_str = str(address).strip()
+            norm = self._norm(address_str)
+            
+            # Repeated address - reuse the result of its first occurrence
+            if norm in normalized_to_batch_index:
+                duplicate_slots.append((i, normalized_to_batch_index[norm]))
+                continue
             
-            # Add to batch processing list (no cache lookup)
-            batch_index = len(addresses_to_process)
+            # Add to batch processing list (original string is sent to AI, not the normalized key)
+            normalized_to_batch_index[norm] = len(addresses_to_process)
             addresses_to_process.append(address_str)
-            addresses_to_process_mapping[batch_index] = original_index
+            ai_slot.append(i)
+        if duplicate_slots:
+            print(f"   ♻️  {len(duplicate_slots)} repeated addresses will reuse earlier results ({len(addresses_to_process)} unique)")
+        
+        # Speculatively geocode the raw addresses while the AI batch runs, using Nominatim's
+        # otherwise idle rate-limit budget; the free-API fallback consumes these results later
+        prefetch_futures = []
+        prefetch_executor = None
+        if use_free_apis and addresses_to_process and 'nominatim' in self._enabled_providers:
+            rate_limit = self.free_apis['nominatim']['rate_limit']
+            prefetch_budget = len(addresses_to_process) if rate_limit <= 0 else int(AI_BATCH_EXPECTED_SECONDS / rate_limit)
+            prefetch_executor = ThreadPoolExecutor(max_workers=2)
+            prefetch_futures = [prefetch_executor.submit(self._geocode_cached, 'nominatim', address) for address in addresses_to_process[:prefetch_budget]]
+        
         # Process non-cached addresses in batch
         batch_results = []
         if addresses_to_process:
@@ -1135,87 +1497,109 @@ class CSVAddressProcessor:
                         }
                         batch_results.append(error_result)
         
-        # Combine cached and batch processed results
-        print(f"   🔀 Combining results: {len(cached_results)} cached, {len(batch_results)} processed, {len(address_batch)} total")
-        all_results = []
-        for i in range(len(address_batch)):
-            if i % 50 == 0:
-                print(f"   📊 Processing result {i+1}/{len(address_batch)}...")
-            
-            original_index = start_index + i
-            
-            # Check if we have a cached result
-            if original_index in cached_results:
-                all_results.append(cached_results[original_index])
-            else:
-                # Find the corresponding batch result
-                batch_index = None
-                for batch_idx, orig_idx in addresses_to_process_mapping.items():
-                    if orig_idx == original_index:
-                        batch_index = batch_idx
-                        break
-                
-                if batch_index is not None and batch_index < len(batch_results):
-                    result = batch_results[batch_index]
-                    
-                    # Convert to our expected format
-                    enhanced_result = {
-                        'status': 'success' if 'error' not in result else 'error',
-                        'original_address': result.get('original_address', address_batch[i]),
-                        'formatted_address': str(result.get('formatted_address', '')),
-                        'street_number': str(result.get('street_number', '') or ''),
-                        'street_name': str(result.get('street_name', '') or ''),
-                        'street_type': str(result.get('street_type', '') or ''),
-                        'unit_type': str(result.get('unit_type', '') or ''),
-                        'unit_number': str(result.get('unit_number', '') or ''),
-                        'city': str(result.get('city', '') or ''),
-                        'state': str(result.get('state', '') or ''),
-                        'postal_code': str(result.get('postal_code', '') or ''),
-                        'country': str(result.get('country', '') or ''),
-                        'country_code': str(result.get('country_code', '') or ''),
-                        'district': str(result.get('district', '') or ''),
-                        'region': str(result.get('region', '') or ''),
-                        'suburb': str(result.get('suburb', '') or ''),
-                        'locality': str(result.get('locality', '') or ''),
-                        'sublocality': str(result.get('sublocality', '') or ''),
-                        'canton': str(result.get('canton', '') or ''),
-                        'prefecture': str(result.get('prefecture', '') or ''),
-                        'oblast': str(result.get('oblast', '') or ''),
-                        'confidence': result.get('confidence', 'unknown'),
-                        'issues': ', '.join(result.get('issues', [])) if result.get('issues') else '',
-                        'api_source': 'azure_openai_batch',
-                        'latitude': '',
-                        'longitude': '',
-                        'from_cache': False,
-                        'address_id': None
-                    }
-                    
-                    # Try to enhance with free APIs if enabled
-                    # Note: Free API enhancement is slow (1-3 seconds per address)
-                    # Only enable with --enable-free-apis flag when geocoding data is needed
-                    if use_free_apis and enhanced_result['status'] == 'success':
-                        enhanced_result = self.fill_missing_components_with_free_apis(
-                            enhanced_result['original_address'], 
-                            enhanced_result
-                        )
-                    
-                    all_results.append(enhanced_result)
-                else:
-                    # Fallback for missing results
-                    all_results.append({
-                        'status': 'error',
-                        'reason': 'missing_result',
-                        'original_address': str(address_batch[i]),
-                        'formatted_address': str(address_batch[i]),
-                        'confidence': 'low',
-                        'from_cache': False,
-                        'address_id': None
-                    })
+        # Stop prefetching once the AI results are in so it doesn't compete with the real lookups
+        if prefetch_executor:
+            prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Fill AI slots directly from the batch results
+        print(f"   🔀 Combining results: {len(address_batch) - len(addresses_to_process)} cached/skipped, {len(batch_results)} processed, {len(address_batch)} total")
+        slot_prefetch = {}  # Maps slot to the prefetched raw-address lookup
+        for batch_index, result in enumerate(batch_results[:len(ai_slot)]):
+            i = ai_slot[batch_index]
+            pending[i] = self._convert_batch_result(result, result.get('original_address', address_batch[i]), False)
+            if batch_index < len(prefetch_futures):
+                slot_prefetch[i] = prefetch_futures[batch_index]
+        
+        # Try to enhance with free APIs if enabled
+        # Note: Free API enhancement is slow (1-3 seconds per address)
+        # Only enable with --enable-free-apis flag when geocoding data is needed
+        if use_free_apis:
+            self._enhance_results_with_free_apis(pending, slot_prefetch)
+        
+        # Repeated addresses copy the (already enhanced) result of their first occurrence; from_cache stays
+        # as it was, since it means the persistent cache, not a repeat within this run
+        for i, batch_index in duplicate_slots:
+            if batch_index < len(batch_results) and pending[ai_slot[batch_index]] is not None:
+                pending[i] = dict(pending[ai_slot[batch_index]], original_address=str(address_batch[i]).strip())
+        
+        # Fallback for slots the AI returned no result for
+        for i, result in enumerate(pending):
+            if result is None:
+                pending[i] = {
+                    'status': 'error',
+                    'reason': 'missing_result',
+                    'original_address': str(address_batch[i]),
+                    'formatted_address': str(address_batch[i]),
+                    'confidence': 'low',
+                    'from_cache': False,
+                    'address_id': None
+                }
         
         # No database saving
-        print(f"   ✅ Combined {len(all_results)} results successfully")
-        print(f"✅ Batch completed: {len(all_results)} results")
-        return all_results
+        print(f"   ✅ Combined {len(pending)} results successfully")
+        print(f"✅ Batch completed: {len(pending)} results")
+        return pending
+    
+    @staticmethod
+    def _copy_text_fields(source: Dict[str, Any], fields) -> Dict[str, str]:
+        """The given fields of an AI result as strings, with missing/empty values as ''"""
+        get = source.get
+        return {field: str(value) if (value := get(field)) else '' for field in fields}
+    
+    def _convert_batch_result(self, result: Dict[str, Any], original_address: str, from_cache: bool) -> Dict[str, Any]:
+        """Convert a raw batch AI result to our expected format"""
+        return {
+            'status': 'success' if 'error' not in result else 'error',
+            'original_address': original_address,
+            'formatted_address': str(result.get('formatted_address') or ''),
+            **self._copy_text_fields(result, AI_RESULT_TEXT_FIELDS),
+            'confidence': result.get('confidence') or 'unknown',
+            'issues': ', '.join(result.get('issues', [])) if result.get('issues') else '',
+            'api_source': 'azure_openai_batch',
+            'latitude': '',
+            'longitude': '',
+            'from_cache': from_cache,
+            'address_id': None
+        }
+    
+    def _enhance_results_with_free_apis(self, results: List[Dict[str, Any]], prefetched_futures: Dict[int, Any] = None):
+        """
+        Fill missing components of the successful results in place, several rows at a time
+        
+        Rows run on a thread pool sized to the combined free-API request budget; _throttle keeps
+        each API host within its own rate limit regardless of the number of workers.
+        """
+        prefetched_futures = prefetched_futures or {}
+        # Rows that already have every key component and coordinates need no worker at all
+        indices = [
+            i for i, result in enumerate(results)
+            if result and result.get('status') == 'success' and self._has_missing_components(result)
+        ]
+        if not indices:
+            return
+        
+        # Requests per second allowed across the enabled APIs, times ~1s typical request latency
+        # (an unthrottled self-hosted API can use every worker)
+        enabled_limits = [self.free_apis[name]['rate_limit'] for name in self._enabled_providers]
+        allowed_qps = 8 if any(limit <= 0 for limit in enabled_limits) else sum(1.0 / limit for limit in enabled_limits)
+        max_workers = max(1, min(8, len(indices), round(allowed_qps)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_index = {
+                executor.submit(
+                    self.fill_missing_components_with_free_apis,
+                    results[i]['original_address'],
+                    results[i],
+                    prefetched_futures.get(i)
+                ): i
+                for i in indices
+            }
+            for future in as_completed(future_to_index):
+                i = future_to_index[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"   ⚠️  Free API enhancement failed for row {i + 1}: {str(e)}")
     
     def apply_address_splitting(self, df: pd.DataFrame, address_columns: List[str]) -> pd.DataFrame:
         """
@@ -1250,9 +1634,10 @@ class CSVAddressProcessor:
         address_pairs = []
         row_indices = []
         
-        for index, row in df.iterrows():
-            address1 = str(row[primary_addr_col]) if pd.notna(row[primary_addr_col]) else ""
-            address2 = str(row[address2_col]) if address2_col and pd.notna(row[address2_col]) else None
+        address2_values = df[address2_col].tolist() if address2_col else [None] * len(df)
+        for index, address1_value, address2_value in zip(df.index, df[primary_addr_col].tolist(), address2_values):
+            address1 = str(address1_value) if pd.notna(address1_value) else ""
+            address2 = str(address2_value) if address2_col and pd.notna(address2_value) else None
             
             # Only process non-empty addresses
             if address1.strip():
@@ -1333,10 +1718,8 @@ class CSVAddressProcessor:
             result_map[idx] = result
         
         # Process all rows with results
-        for index, row in df.iterrows():
-            row_dict = row.to_dict()
-            
-            address1 = str(row[primary_addr_col]) if pd.notna(row[primary_addr_col]) else ""
+        for index, row_dict in zip(df.index, df.to_dict('records')):
+            address1 = str(row_dict[primary_addr_col]) if pd.notna(row_dict[primary_addr_col]) else ""
             
             # Skip empty addresses
             if not address1.strip():
@@ -1376,7 +1759,7 @@ class CSVAddressProcessor:
                     new_row['Split_Address_Number'] = f"{split_idx} of {split_result['split_count']}"
                     
                     # Clear address2 if it was used in splitting
-                    address2 = str(row[address2_col]) if address2_col and pd.notna(row[address2_col]) else None
+                    address2 = str(row_dict[address2_col]) if address2_col and pd.notna(row_dict[address2_col]) else None
                     if address2_col and address2:
                         new_row[address2_col] = ''
                     
@@ -1413,7 +1796,7 @@ class CSVAddressProcessor:
                         address_column: str = None, address_columns: List[str] = None,
                         batch_size: int = 10, use_free_apis: bool = False, 
                         enable_batch_processing: bool = True, enable_split: bool = False,
-                        use_gpt_split: bool = False) -> str:
+                        use_gpt_split: bool = False, chunk_size: int = None) -> str:
         """
         Process a CSV or Excel file and standardize addresses using efficient batch processing
         
@@ -1427,6 +1810,7 @@ class CSVAddressProcessor:
             enable_batch_processing: Whether to use batch processing for efficiency
             enable_split: Whether to enable address splitting (default: False)
             use_gpt_split: Whether to use GPT for splitting instead of rules (default: False)
+            chunk_size: Read and process a CSV this many rows at a time to bound memory (optional)
         
         Returns:
             Path to the output file
@@ -1436,31 +1820,20 @@ class CSVAddressProcessor:
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
         
-        # Load CSV or Excel file based on file extension
+        # Load CSV or Excel file based on file extension (large CSVs can be streamed in chunks instead)
         file_ext = os.path.splitext(input_file)[1].lower()
-        try:
-            if file_ext in ['.xlsx', '.xls']:
-                # Read Excel file
-                print(f"📊 Reading Excel file: {input_file}")
-                df = pd.read_excel(input_file)
-            elif file_ext in ['.csv', '.txt']:
-                # Read CSV file with encoding detection
-                print(f"📄 Reading CSV file: {input_file}")
-                try:
-                    df = pd.read_csv(input_file, encoding='utf-8')
-                except UnicodeDecodeError:
-                    df = pd.read_csv(input_file, encoding='latin-1')
-            else:
-                raise Exception(f"Unsupported file format: {file_ext}. Supported formats: .csv, .xlsx, .xls")
-        except Exception as e:
-            raise Exception(f"Could not read file: {str(e)}")
-        
-        print(f"Loaded CSV with {len(df)} rows and {len(df.columns)} columns")
-        print(f"Columns: {', '.join(df.columns.tolist())}")
+        if not chunk_size and file_ext in ['.csv', '.txt'] and os.path.getsize(input_file) > AUTO_CHUNK_THRESHOLD_BYTES:
+            chunk_size = AUTO_CHUNK_SIZE
+            print(f"📦 Large CSV ({os.path.getsize(input_file) / (1024 * 1024):.0f} MB) - processing in chunks of {chunk_size} rows")
+        chunked = bool(chunk_size) and file_ext in ['.csv', '.txt']
+        if chunked:
+            print(f"📄 Streaming CSV file in chunks of {chunk_size} rows: {input_file}")
+        else:
+            df = self._load_input_file(input_file, file_ext)
         
         if use_free_apis:
             print(f"🌐 Free API enhancement: ENABLED")
-            print(f"   Available APIs: {', '.join([k for k, v in self.free_apis.items() if v['enabled']])}")
+            print(f"   Available APIs: {', '.join(self._enabled_providers)}")
         else:
             print(f"🌐 Free API enhancement: DISABLED")
         
@@ -1481,6 +1854,57 @@ class CSVAddressProcessor:
         else:
             print(f"✂️  Address splitting: DISABLED")
         
+        if chunked:
+            result_file = self._process_csv_in_chunks(
+                input_file, output_file, chunk_size,
+                address_column=address_column, address_columns=address_columns, use_free_apis=use_free_apis,
+                enable_batch_processing=enable_batch_processing, enable_split=enable_split
+            )
+        else:
+            result_file = self._process_loaded_dataframe(
+                df, output_file,
+                address_column=address_column, address_columns=address_columns, use_free_apis=use_free_apis,
+                enable_batch_processing=enable_batch_processing, enable_split=enable_split
+            )
+        
+        # Archive input file if it was from inbound directory and processing was successful
+        if result_file:
+            self.archive_single_inbound_file(input_file)
+            
+        return result_file
+    
+    def _load_input_file(self, input_file: str, file_ext: str) -> pd.DataFrame:
+        """Read a whole CSV or Excel input file into a DataFrame"""
+        try:
+            if file_ext in ['.xlsx', '.xls']:
+                # Read Excel file
+                print(f"📊 Reading Excel file: {input_file}")
+                df = pd.read_excel(input_file)
+            elif file_ext in ['.csv', '.txt']:
+                # Read CSV file with encoding detection (decided up front so the file is parsed only once)
+                print(f"📄 Reading CSV file: {input_file}")
+                encoding = self._detect_csv_encoding(input_file)
+                # Every column is read as text, as the chunked reader does, so pass-through values (leading
+                # zeros, timestamps, ids) reach the output unchanged whatever the file size
+                # Multi-threaded Arrow parser when pyarrow is installed
+                df = _read_csv_with_arrow(input_file, encoding, delimiter=',')
+                if df is None:
+                    # pyarrow missing, or a file its stricter parser rejects (e.g. ragged rows)
+                    print("   ℹ️  Using standard CSV parser")
+                    df = pd.read_csv(input_file, encoding=encoding, dtype=str, memory_map=True)
+            else:
+                raise Exception(f"Unsupported file format: {file_ext}. Supported formats: .csv, .xlsx, .xls")
+        except Exception as e:
+            raise Exception(f"Could not read file: {str(e)}")
+        
+        print(f"Loaded CSV with {len(df)} rows and {len(df.columns)} columns")
+        print(f"Columns: {', '.join(df.columns.tolist())}")
+        return df
+    
+    def _process_loaded_dataframe(self, df: pd.DataFrame, output_file: str, address_column: str = None,
+                                  address_columns: List[str] = None, use_free_apis: bool = False,
+                                  enable_batch_processing: bool = True, enable_split: bool = False) -> str:
+        """Run the processing path that matches the DataFrame's columns and return the output file"""
         # Determine processing method based on parameters
         result_file = None
         
@@ -1502,12 +1926,90 @@ class CSVAddressProcessor:
                 # Process regular address format
                 result_file = self.process_regular_address_format(df, address_column, output_file, use_free_apis, enable_batch_processing, enable_split)
         
-        # Archive input file if it was from inbound directory and processing was successful
-        if result_file:
-            self.archive_single_inbound_file(input_file)
-            
         return result_file
     
+    def _detect_csv_encoding(self, input_file: str) -> str:
+        """Return 'utf-8' if the whole file decodes as UTF-8, else 'latin-1' (streams the file, constant memory)"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        try:
+            with open(input_file, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    decoder.decode(block)
+            decoder.decode(b'', final=True)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'latin-1'
+    
+    def _process_csv_in_chunks(self, input_file: str, output_file: str, chunk_size: int, **process_kwargs) -> str:
+        """
+        Process a large CSV chunk_size rows at a time, so memory is bounded by the chunk rather than the file
+        
+        Each chunk goes through the normal processing path into a part file under work_dir, and is
+        appended to the output on a background writer (and fsynced) while the next chunk is processed.
+        Part files are only removed once every chunk is done. They are keyed by the input file (path,
+        size, modification time), the chunk size and the processing options rather than the output
+        name, so a run that dies part-way - including an inbound batch run, whose output names are
+        timestamped - reuses the chunks that already finished when the same file is processed again.
+        """
+        output_file = self._resolve_output_path(output_file)
+        compress = output_file.lower().endswith('.csv.gz')
+        if not compress and not output_file.lower().endswith('.csv'):
+            # Only the last suffix is replaced, and one that follows .csv (e.g. .csv.bz2) is just dropped
+            base = output_file[:-len(Path(output_file).suffix)] if Path(output_file).suffix else output_file
+            output_file = base if base.lower().endswith('.csv') else f"{base}.csv"
+            print(f"⚠️ Chunked processing writes CSV or gzip CSV only - saving to {output_file}")
+        
+        input_stat = os.stat(input_file)
+        run_key = hashlib.sha1(repr((
+            os.path.abspath(input_file), input_stat.st_size, input_stat.st_mtime_ns, chunk_size, sorted(process_kwargs.items())
+        )).encode('utf-8')).hexdigest()[:12]
+        parts_dir = self.work_dir / f"{Path(input_file).stem}-{run_key}"
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        
+        encoding = self._detect_csv_encoding(input_file)
+        rows_done = 0
+        chunk_number = 0
+        written_file = f"{output_file}.tmp"
+        
+        def append_part(part_file: str, is_first: bool):
+            with open(part_file, 'rb') as part:
+                if not is_first:
+                    part.readline()  # Header (and BOM) were already written by the first chunk
+                shutil.copyfileobj(part, out)
+            out.flush()
+            raw_out.flush()
+            os.fsync(raw_out.fileno())
+        
+        # One writer thread keeps the parts in order while the next chunk's API calls run
+        with open(written_file, 'wb') as raw_out, ThreadPoolExecutor(max_workers=1) as writer:
+            # Parts are plain CSV; a .csv.gz output compresses them as they are appended
+            out = gzip.GzipFile(fileobj=raw_out, mode='wb') if compress else raw_out
+            appends = []
+            # Read as text so every chunk keeps the source values verbatim (leading zeros, ids) instead of
+            # each chunk inferring its own, possibly different, dtypes
+            for chunk_df in pd.read_csv(input_file, encoding=encoding, chunksize=chunk_size, dtype=str, memory_map=True):
+                chunk_number += 1
+                part_file = str(parts_dir / f"part{chunk_number}.csv")
+                if os.path.exists(part_file):
+                    print(f"\n⏭️  Chunk {chunk_number}: rows {rows_done + 1}-{rows_done + len(chunk_df)} already processed - reusing {os.path.basename(part_file)}")
+                else:
+                    print(f"\n📦 Chunk {chunk_number}: rows {rows_done + 1}-{rows_done + len(chunk_df)}")
+                    # Written under a temporary name first so an interrupted chunk is never mistaken for a finished one
+                    chunk_file = self._process_loaded_dataframe(chunk_df, str(parts_dir / f"part{chunk_number}.tmp.csv"), **process_kwargs)
+                    os.replace(chunk_file, part_file)
+                appends.append(writer.submit(append_part, part_file, chunk_number == 1))
+                rows_done += len(chunk_df)
+            
+            for append in appends:
+                append.result()
+            if compress:
+                out.close()  # Writes the gzip trailer; raw_out is closed by the with block
+        os.replace(written_file, output_file)
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        
+        print(f"\n✅ Processed {rows_done} rows in {chunk_number} chunks -> {output_file}")
+        return output_file
+    
     def process_site_address_format(self, df: pd.DataFrame, output_file: str = None, use_free_apis: bool = False, enable_split: bool = False) -> str:
         """Process CSV with site address column structure"""
         
@@ -1520,7 +2022,7 @@ class CSVAddressProcessor:
         country_column = self.detect_country_column(df)
         
         # Add combined address column
-        df['Combined_Address'] = df.apply(self.combine_site_address_fields, axis=1)
+        df['Combined_Address'] = self.combine_site_address_columns(df)
         
         # Handle address splitting if enabled
         if enable_split and self.address_splitter:
@@ -1528,26 +2030,8 @@ class CSVAddressProcessor:
             df = self.apply_address_splitting(df, ['Combined_Address'])
             print(f"✅ Address splitting completed. New row count: {len(df)}")
         
-        # Add standardization result columns (including new database-related columns)
+        # Standardization result columns ({base_col_name}_<field>) are added in bulk after processing
         base_col_name = "Standardized_Address"
-        df[f"{base_col_name}_formatted"] = ""
-        df[f"{base_col_name}_street_number"] = ""
-        df[f"{base_col_name}_street_name"] = ""
-        df[f"{base_col_name}_street_type"] = ""
-        df[f"{base_col_name}_unit_type"] = ""
-        df[f"{base_col_name}_unit_number"] = ""
-        df[f"{base_col_name}_city"] = ""
-        df[f"{base_col_name}_state"] = ""
-        df[f"{base_col_name}_postal_code"] = ""
-        df[f"{base_col_name}_country"] = ""
-        df[f"{base_col_name}_confidence"] = ""
-        df[f"{base_col_name}_issues"] = ""
-        df[f"{base_col_name}_status"] = ""
-        df[f"{base_col_name}_api_source"] = ""
-        df[f"{base_col_name}_latitude"] = ""
-        df[f"{base_col_name}_longitude"] = ""
-        df[f"{base_col_name}_address_id"] = ""  # New: Unique database ID
-        df[f"{base_col_name}_from_cache"] = ""  # New: Whether from cache
         
         # Process each row
         total_rows = len(df)
@@ -1571,91 +2055,59 @@ class CSVAddressProcessor:
         else:
             print(f"   Using individual processing")
         
-        # Process in batches
-        for batch_start in range(0, total_rows, batch_size):
-            batch_end = min(batch_start + batch_size, total_rows)
-            batch_df = df.iloc[batch_start:batch_end]
-            
-            # Extract addresses and countries for this batch
-            batch_addresses = []
-            batch_countries = []
-            batch_indices = []
-            
-            for idx, (_, row) in enumerate(batch_df.iterrows()):
-                combined_address = row['Combined_Address']
-                batch_addresses.append(combined_address)
-                
-                # Get target country from column if available
-                target_country = None
-                if country_column and country_column in row:
-                    target_country = str(row[country_column]).strip() if pd.notna(row[country_column]) else None
-                batch_countries.append(target_country)
-                batch_indices.append(batch_start + idx)
-            
-            # Process this batch
-            if enable_batch and len(batch_addresses) > 1:
-                print(f"   Processing batch {batch_start//batch_size + 1}: rows {batch_start+1}-{batch_end}")
-                
-                # Use the most common country in the batch, or None
-                common_country = max(set(batch_countries), key=batch_countries.count) if any(batch_countries) else None
-                
-                batch_results = self.standardize_addresses_batch(
-                    batch_addresses, 
-                    batch_start, 
-                    target_country=common_country, 
+        # Column values read once as plain lists; batches slice them instead of iterating rows
+        combined_addresses = df['Combined_Address'].tolist()
+        if country_column and country_column in df.columns:
+            # Get target country from column if available
+            row_countries = [str(value).strip() if pd.notna(value) else None for value in df[country_column].tolist()]
+        else:
+            row_countries = [None] * total_rows
+        
+        # Repeated addresses (same office on many records) are standardized once and copied back
+        unique_positions, row_to_unique = self._unique_address_positions(combined_addresses, row_countries)
+        unique_addresses = [combined_addresses[i] for i in unique_positions]
+        unique_countries = [row_countries[i] for i in unique_positions]
+        total_unique = len(unique_positions)
+        if total_unique < total_rows:
+            print(f"   {total_rows - total_unique} repeated addresses will reuse earlier results ({total_unique} unique)")
+        
+        if enable_batch:
+            # One standardize_addresses_batch call per target country; each call already chunks and
+            # parallelizes its AI and geocoding work, so the calls themselves run one after another
+            country_groups = {}
+            for unique_index, country in enumerate(unique_countries):
+                country_groups.setdefault(country, []).append(unique_index)
+            unique_results = [None] * total_unique
+            done = 0
+            for country, group in country_groups.items():
+                group_results = self.standardize_addresses_batch(
+                    [unique_addresses[i] for i in group],
+                    0,
+                    target_country=country,
                     use_free_apis=use_free_apis
                 )
+                for unique_index, result in zip(group, group_results):
+                    unique_results[unique_index] = result
+                
+                # Progress indicator
+                done += len(group)
+                print(f"Progress: {done}/{total_unique} unique addresses ({done/total_unique*100:.1f}%)")
+        else:
+            # Individual processing: the row pool already runs addresses concurrently and reports progress
+            unique_results = self._standardize_rows_concurrently(unique_addresses, unique_positions, unique_countries, use_free_apis)
+        
+        all_results = self._broadcast_unique_results(unique_results, unique_positions, row_to_unique)
+        for result in all_results:
+            processed_count += 1
+            if result.get('status') == 'success':
+                success_count += 1
             else:
-                # Individual processing for small batches or when batch processing is disabled
-                batch_results = []
-                for i, address in enumerate(batch_addresses):
-                    result = self.standardize_single_address(
-                        address, 
-                        batch_start + i, 
-                        batch_countries[i], 
-                        use_free_apis
-                    )
-                    batch_results.append(result)
-            
-            # Update DataFrame with batch results
-            for i, result in enumerate(batch_results):
-                df_index = batch_start + i
-                
-                # Update DataFrame with results
-                df.at[df_index, f"{base_col_name}_formatted"] = result.get('formatted_address', '')
-                df.at[df_index, f"{base_col_name}_street_number"] = result.get('street_number', '')
-                df.at[df_index, f"{base_col_name}_street_name"] = result.get('street_name', '')
-                df.at[df_index, f"{base_col_name}_street_type"] = result.get('street_type', '')
-                df.at[df_index, f"{base_col_name}_unit_type"] = result.get('unit_type', '')
-                df.at[df_index, f"{base_col_name}_unit_number"] = result.get('unit_number', '')
-                df.at[df_index, f"{base_col_name}_city"] = result.get('city', '')
-                df.at[df_index, f"{base_col_name}_state"] = result.get('state', '')
-                df.at[df_index, f"{base_col_name}_postal_code"] = result.get('postal_code', '')
-                df.at[df_index, f"{base_col_name}_country"] = result.get('country', '')
-                df.at[df_index, f"{base_col_name}_confidence"] = result.get('confidence', '')
-                df.at[df_index, f"{base_col_name}_issues"] = result.get('issues', '')
-                df.at[df_index, f"{base_col_name}_status"] = result.get('status', '')
-                df.at[df_index, f"{base_col_name}_api_source"] = result.get('api_source', '')
-                df.at[df_index, f"{base_col_name}_latitude"] = result.get('latitude', '')
-                df.at[df_index, f"{base_col_name}_longitude"] = result.get('longitude', '')
-                df.at[df_index, f"{base_col_name}_address_id"] = result.get('address_id', '')
-                df.at[df_index, f"{base_col_name}_from_cache"] = 'Yes' if result.get('from_cache', False) else 'No'
-                
-                processed_count += 1
-                if result.get('status') == 'success':
-                    success_count += 1
-                else:
-                    error_count += 1
-                    
-                if result.get('from_cache', False):
-                    cached_count += 1
-            
-            # Progress indicator
-            print(f"Progress: {processed_count}/{total_rows} ({processed_count/total_rows*100:.1f}%) - {cached_count} cached")
-            
-            # Small delay between batches to avoid overwhelming the API
-            if not enable_batch:
-                time.sleep(0.1)
+                error_count += 1
+                
+            if result.get('from_cache', False):
+                cached_count += 1
+        
+        self._assign_result_columns(df, base_col_name, all_results, SITE_RESULT_COLUMN_SUFFIXES)
         
         # Print enhanced summary with cache statistics
         print(f"\n📊 Processing Summary:")
@@ -1685,7 +2137,7 @@ class CSVAddressProcessor:
             raise ValueError(f"Missing columns: {', '.join(missing_columns)}")
         
         # Add combined address column using user-specified columns
-        df['Combined_Address'] = df.apply(lambda row: self.combine_address_columns(row, address_columns), axis=1)
+        df['Combined_Address'] = self.combine_address_columns_vectorized(df, address_columns)
         
         # Handle address splitting if enabled
         if enable_split and self.address_splitter:
@@ -1699,35 +2151,8 @@ class CSVAddressProcessor:
             if df.iloc[i]['Combined_Address']:
                 print(f"   Row {i+1}: {df.iloc[i]['Combined_Address'][:80]}...")
         
-        # Add standardization result columns
+        # Standardization result columns ({base_col_name}_<field>) are added in bulk after processing
         base_col_name = "Standardized_Address"
-        df[f"{base_col_name}_formatted"] = ""
-        df[f"{base_col_name}_street_number"] = ""
-        df[f"{base_col_name}_street_name"] = ""
-        df[f"{base_col_name}_street_type"] = ""
-        df[f"{base_col_name}_unit_type"] = ""
-        df[f"{base_col_name}_unit_number"] = ""
-        df[f"{base_col_name}_city"] = ""
-        df[f"{base_col_name}_state"] = ""
-        df[f"{base_col_name}_postal_code"] = ""
-        df[f"{base_col_name}_country"] = ""
-        df[f"{base_col_name}_country_code"] = ""
-        df[f"{base_col_name}_district"] = ""
-        df[f"{base_col_name}_region"] = ""
-        df[f"{base_col_name}_suburb"] = ""
-        df[f"{base_col_name}_locality"] = ""
-        df[f"{base_col_name}_sublocality"] = ""
-        df[f"{base_col_name}_canton"] = ""
-        df[f"{base_col_name}_prefecture"] = ""
-        df[f"{base_col_name}_oblast"] = ""
-        df[f"{base_col_name}_confidence"] = ""
-        df[f"{base_col_name}_issues"] = ""
-        df[f"{base_col_name}_status"] = ""
-        df[f"{base_col_name}_api_source"] = ""
-        df[f"{base_col_name}_latitude"] = ""
-        df[f"{base_col_name}_longitude"] = ""
-        df[f"{base_col_name}_address_id"] = ""
-        df[f"{base_col_name}_from_cache"] = ""
         
         # Process each combined address
         total_rows = len(df)
@@ -1738,66 +2163,38 @@ class CSVAddressProcessor:
         
         print(f"\n🚀 Processing {total_rows} combined addresses...")
         
-        for df_index, row in df.iterrows():
-            combined_address = row['Combined_Address']
-            
-            if not combined_address or pd.isna(combined_address):
-                # Handle empty combined address
-                df.at[df_index, f"{base_col_name}_status"] = "skipped"
-                df.at[df_index, f"{base_col_name}_issues"] = "empty_combined_address"
-                df.at[df_index, f"{base_col_name}_confidence"] = "n/a"
+        try:
+            from app.config.address_config import PROMPT_CONFIG
+            enable_batch = PROMPT_CONFIG.get("enable_batch_processing", True)
+        except ImportError:
+            enable_batch = True
+        
+        # Empty combined addresses are skipped without an API call
+        combined_addresses = df['Combined_Address'].tolist()
+        all_results = [{'status': 'skipped', 'issues': 'empty_combined_address', 'confidence': 'n/a'} for _ in combined_addresses]
+        positions = [i for i, address in enumerate(combined_addresses) if address and not pd.isna(address)]
+        
+        if enable_batch and len(positions) > 1:
+            # One batched standardization call for all non-empty rows (internally chunked and parallelized)
+            batch_results = self.standardize_addresses_batch([combined_addresses[i] for i in positions], 0, use_free_apis=use_free_apis)
+            for i, result in zip(positions, batch_results):
+                all_results[i] = result
+        else:
+            results = self._standardize_rows_concurrently([combined_addresses[i] for i in positions], positions, use_free_apis=use_free_apis)
+            for i, result in zip(positions, results):
+                all_results[i] = result
+        
+        for result in all_results:
+            processed_count += 1
+            if result.get('status') == 'success':
+                success_count += 1
+            else:
                 error_count += 1
-                processed_count += 1
-                continue
-            
-            # Standardize the combined address
-            result = self.standardize_single_address(combined_address, df_index)
-            
-            # Update DataFrame with results
-            if result:
-                df.at[df_index, f"{base_col_name}_formatted"] = result.get('formatted_address', '')
-                df.at[df_index, f"{base_col_name}_street_number"] = result.get('street_number', '')
-                df.at[df_index, f"{base_col_name}_street_name"] = result.get('street_name', '')
-                df.at[df_index, f"{base_col_name}_street_type"] = result.get('street_type', '')
-                df.at[df_index, f"{base_col_name}_unit_type"] = result.get('unit_type', '')
-                df.at[df_index, f"{base_col_name}_unit_number"] = result.get('unit_number', '')
-                df.at[df_index, f"{base_col_name}_city"] = result.get('city', '')
-                df.at[df_index, f"{base_col_name}_state"] = result.get('state', '')
-                df.at[df_index, f"{base_col_name}_postal_code"] = result.get('postal_code', '')
-                df.at[df_index, f"{base_col_name}_country"] = result.get('country', '')
-                df.at[df_index, f"{base_col_name}_country_code"] = result.get('country_code', '')
-                df.at[df_index, f"{base_col_name}_district"] = result.get('district', '')
-                df.at[df_index, f"{base_col_name}_region"] = result.get('region', '')
-                df.at[df_index, f"{base_col_name}_suburb"] = result.get('suburb', '')
-                df.at[df_index, f"{base_col_name}_locality"] = result.get('locality', '')
-                df.at[df_index, f"{base_col_name}_sublocality"] = result.get('sublocality', '')
-                df.at[df_index, f"{base_col_name}_canton"] = result.get('canton', '')
-                df.at[df_index, f"{base_col_name}_prefecture"] = result.get('prefecture', '')
-                df.at[df_index, f"{base_col_name}_oblast"] = result.get('oblast', '')
-                df.at[df_index, f"{base_col_name}_confidence"] = result.get('confidence', '')
-                df.at[df_index, f"{base_col_name}_issues"] = result.get('issues', '')
-                df.at[df_index, f"{base_col_name}_status"] = result.get('status', '')
-                df.at[df_index, f"{base_col_name}_api_source"] = result.get('api_source', '')
-                df.at[df_index, f"{base_col_name}_latitude"] = result.get('latitude', '')
-                df.at[df_index, f"{base_col_name}_longitude"] = result.get('longitude', '')
-                df.at[df_index, f"{base_col_name}_address_id"] = result.get('address_id', '')
-                df.at[df_index, f"{base_col_name}_from_cache"] = 'Yes' if result.get('from_cache', False) else 'No'
-                
-                processed_count += 1
-                if result.get('status') == 'success':
-                    success_count += 1
-                else:
-                    error_count += 1
-                    
-                if result.get('from_cache', False):
-                    cached_count += 1
-            
-            # Progress indicator
-            if (processed_count + 1) % 5 == 0 or processed_count == total_rows - 1:
-                print(f"Progress: {processed_count + 1}/{total_rows} ({(processed_count + 1)/total_rows*100:.1f}%) - {cached_count} cached")
-            
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.1)
+            if result.get('from_cache', False):
+                cached_count += 1
+        
+        # Write all results into the DataFrame in bulk
+        self._assign_result_columns(df, base_col_name, all_results, RESULT_COLUMN_SUFFIXES)
         
         # Print enhanced summary with cache statistics
         print(f"\n📊 Processing Summary:")
@@ -1836,7 +2233,7 @@ class CSVAddressProcessor:
             
             # NOW combine the (possibly split) components
             print(f"\n🔗 Combining address components into complete addresses...")
-            df['Combined_Address'] = df.apply(lambda row: self.combine_separated_address_components(row, separated_components), axis=1)
+            df['Combined_Address'] = self.combine_separated_address_components_vectorized(df, separated_components)
             
             # Use the combined address column for processing
             address_columns = ['Combined_Address']
@@ -1884,35 +2281,8 @@ class CSVAddressProcessor:
             print(f"\nProcessing column: {addr_col}")
             print("=" * 50)
             
-            # Add new columns for standardized data
+            # New columns for standardized data ({base_col_name}_<field>) are added in bulk after processing
             base_col_name = f"{addr_col}_standardized"
-            df[f"{base_col_name}_formatted"] = ""
-            df[f"{base_col_name}_street_number"] = ""
-            df[f"{base_col_name}_street_name"] = ""
-            df[f"{base_col_name}_street_type"] = ""
-            df[f"{base_col_name}_unit_type"] = ""
-            df[f"{base_col_name}_unit_number"] = ""
-            df[f"{base_col_name}_city"] = ""
-            df[f"{base_col_name}_state"] = ""
-            df[f"{base_col_name}_postal_code"] = ""
-            df[f"{base_col_name}_country"] = ""
-            df[f"{base_col_name}_country_code"] = ""
-            df[f"{base_col_name}_district"] = ""
-            df[f"{base_col_name}_region"] = ""
-            df[f"{base_col_name}_suburb"] = ""
-            df[f"{base_col_name}_locality"] = ""
-            df[f"{base_col_name}_sublocality"] = ""
-            df[f"{base_col_name}_canton"] = ""
-            df[f"{base_col_name}_prefecture"] = ""
-            df[f"{base_col_name}_oblast"] = ""
-            df[f"{base_col_name}_confidence"] = ""
-            df[f"{base_col_name}_issues"] = ""
-            df[f"{base_col_name}_status"] = ""
-            df[f"{base_col_name}_api_source"] = ""
-            df[f"{base_col_name}_latitude"] = ""
-            df[f"{base_col_name}_longitude"] = ""
-            df[f"{base_col_name}_address_id"] = ""  # New: Unique database ID
-            df[f"{base_col_name}_from_cache"] = ""  # New: Whether from cache
             
             # Process addresses in batches
             total_rows = len(df)
@@ -1929,14 +2299,14 @@ class CSVAddressProcessor:
                 all_addresses = []
                 all_countries = []
                 
-                for _, row in df.iterrows():
-                    address = row[addr_col]
+                row_columns = [addr_col] + ([country_column] if country_column else [])
+                for address, *country_value in df[row_columns].itertuples(index=False, name=None):
                     all_addresses.append(address)
                     
                     # Get target country from column if available
                     target_country = None
-                    if country_column and country_column in row:
-                        target_country = str(row[country_column]).strip() if pd.notna(row[country_column]) else None
+                    if country_value:
+                        target_country = str(country_value[0]).strip() if pd.notna(country_value[0]) else None
                     all_countries.append(target_country)
                 
                 # Process ALL addresses at once (standardize_multiple_addresses handles internal batching & parallelization)
@@ -1977,34 +2347,8 @@ class CSVAddressProcessor:
                             'confidence': 'low'
                         })
                 
-                # Extract all values into lists for bulk assignment
-                df[f"{base_col_name}_formatted"] = [r.get('formatted_address', '') for r in batch_results]
-                df[f"{base_col_name}_street_number"] = [r.get('street_number', '') for r in batch_results]
-                df[f"{base_col_name}_street_name"] = [r.get('street_name', '') for r in batch_results]
-                df[f"{base_col_name}_street_type"] = [r.get('street_type', '') for r in batch_results]
-                df[f"{base_col_name}_unit_type"] = [r.get('unit_type', '') for r in batch_results]
-                df[f"{base_col_name}_unit_number"] = [r.get('unit_number', '') for r in batch_results]
-                df[f"{base_col_name}_city"] = [r.get('city', '') for r in batch_results]
-                df[f"{base_col_name}_state"] = [r.get('state', '') for r in batch_results]
-                df[f"{base_col_name}_postal_code"] = [r.get('postal_code', '') for r in batch_results]
-                df[f"{base_col_name}_country"] = [r.get('country', '') for r in batch_results]
-                df[f"{base_col_name}_country_code"] = [r.get('country_code', '') for r in batch_results]
-                df[f"{base_col_name}_district"] = [r.get('district', '') for r in batch_results]
-                df[f"{base_col_name}_region"] = [r.get('region', '') for r in batch_results]
-                df[f"{base_col_name}_suburb"] = [r.get('suburb', '') for r in batch_results]
-                df[f"{base_col_name}_locality"] = [r.get('locality', '') for r in batch_results]
-                df[f"{base_col_name}_sublocality"] = [r.get('sublocality', '') for r in batch_results]
-                df[f"{base_col_name}_canton"] = [r.get('canton', '') for r in batch_results]
-                df[f"{base_col_name}_prefecture"] = [r.get('prefecture', '') for r in batch_results]
-                df[f"{base_col_name}_oblast"] = [r.get('oblast', '') for r in batch_results]
-                df[f"{base_col_name}_confidence"] = [r.get('confidence', '') for r in batch_results]
-                df[f"{base_col_name}_issues"] = [r.get('issues', '') for r in batch_results]
-                df[f"{base_col_name}_status"] = [r.get('status', '') for r in batch_results]
-                df[f"{base_col_name}_api_source"] = [r.get('api_source', '') for r in batch_results]
-                df[f"{base_col_name}_latitude"] = [r.get('latitude', '') for r in batch_results]
-                df[f"{base_col_name}_longitude"] = [r.get('longitude', '') for r in batch_results]
-                df[f"{base_col_name}_address_id"] = [r.get('address_id', '') for r in batch_results]
-                df[f"{base_col_name}_from_cache"] = ['Yes' if r.get('from_cache', False) else 'No' for r in batch_results]
+                # One bulk column assignment per result field
+                self._assign_result_columns(df, base_col_name, batch_results, RESULT_COLUMN_SUFFIXES)
                 
                 update_time = time.time() - update_start
                 print(f"✅ DataFrame updated in {update_time:.2f}s")
@@ -2022,45 +2366,15 @@ class CSVAddressProcessor:
                 # Use individual processing
                 print(f"🔄 Processing {total_rows} addresses individually...")
                 
-                for index, row in df.iterrows():
-                    address = row[addr_col]
-                    
+                addresses = df[addr_col].tolist()
+                if country_column:
                     # Get target country from column if available
-                    target_country = None
-                    if country_column and country_column in row:
-                        target_country = str(row[country_column]).strip() if pd.notna(row[country_column]) else None
-                        
-                    result = self.standardize_single_address(address, index, target_country, use_free_apis)
-                    
-                    # Update DataFrame with results
-                    df.at[index, f"{base_col_name}_formatted"] = result.get('formatted_address', '')
-                    df.at[index, f"{base_col_name}_street_number"] = result.get('street_number', '')
-                    df.at[index, f"{base_col_name}_street_name"] = result.get('street_name', '')
-                    df.at[index, f"{base_col_name}_street_type"] = result.get('street_type', '')
-                    df.at[index, f"{base_col_name}_unit_type"] = result.get('unit_type', '')
-                    df.at[index, f"{base_col_name}_unit_number"] = result.get('unit_number', '')
-                    df.at[index, f"{base_col_name}_city"] = result.get('city', '')
-                    df.at[index, f"{base_col_name}_state"] = result.get('state', '')
-                    df.at[index, f"{base_col_name}_postal_code"] = result.get('postal_code', '')
-                    df.at[index, f"{base_col_name}_country"] = result.get('country', '')
-                    df.at[index, f"{base_col_name}_country_code"] = result.get('country_code', '')
-                    df.at[index, f"{base_col_name}_district"] = result.get('district', '')
-                    df.at[index, f"{base_col_name}_region"] = result.get('region', '')
-                    df.at[index, f"{base_col_name}_suburb"] = result.get('suburb', '')
-                    df.at[index, f"{base_col_name}_locality"] = result.get('locality', '')
-                    df.at[index, f"{base_col_name}_sublocality"] = result.get('sublocality', '')
-                    df.at[index, f"{base_col_name}_canton"] = result.get('canton', '')
-                    df.at[index, f"{base_col_name}_prefecture"] = result.get('prefecture', '')
-                    df.at[index, f"{base_col_name}_oblast"] = result.get('oblast', '')
-                    df.at[index, f"{base_col_name}_confidence"] = result.get('confidence', '')
-                    df.at[index, f"{base_col_name}_issues"] = result.get('issues', '')
-                    df.at[index, f"{base_col_name}_status"] = result.get('status', '')
-                    df.at[index, f"{base_col_name}_api_source"] = result.get('api_source', '')
-                    df.at[index, f"{base_col_name}_latitude"] = result.get('latitude', '')
-                    df.at[index, f"{base_col_name}_longitude"] = result.get('longitude', '')
-                    df.at[index, f"{base_col_name}_address_id"] = result.get('address_id', '')
-                    df.at[index, f"{base_col_name}_from_cache"] = 'Yes' if result.get('from_cache', False) else 'No'
-                    
+                    countries = [str(value).strip() if pd.notna(value) else None for value in df[country_column].tolist()]
+                else:
+                    countries = None
+                individual_results = self._standardize_rows_concurrently(addresses, df.index.tolist(), countries, use_free_apis)
+                
+                for result in individual_results:
                     processed_count += 1
                     if result.get('status') == 'success':
                         success_count += 1
@@ -2069,14 +2383,11 @@ class CSVAddressProcessor:
                         
                     if result.get('from_cache', False):
                         cached_count += 1
-                    
-                    # Progress indicator
-                    if processed_count % 10 == 0:
-                        print(f"Progress: {processed_count}/{total_rows} ({processed_count/total_rows*100:.1f}%) - {cached_count} cached")
-                    
-                    # Small delay to avoid overwhelming the API (only for non-cached)
-                    if not result.get('from_cache', False):
-                        time.sleep(0.1)
+                
+                print(f"Progress: {processed_count}/{total_rows} (100.0%) - {cached_count} cached")
+                
+                # Write all results into the DataFrame in bulk
+                self._assign_result_columns(df, base_col_name, individual_results, RESULT_COLUMN_SUFFIXES)
             
             total_processed += processed_count
             total_success += success_count
@@ -2089,9 +2400,118 @@ class CSVAddressProcessor:
         print(f"⏱️  save_and_summarize_results took: {save_time:.2f}s")
         return result
     
-    def save_and_summarize_results(self, df: pd.DataFrame, output_file: str, processed_count: int, success_count: int, error_count: int, address_columns: List[str]) -> str:
-        """Save results and display summary"""
+    def _standardize_rows_concurrently(self, addresses: List[Any], row_indices, countries: List[str] = None, use_free_apis: bool = False) -> List[Dict[str, Any]]:
+        """
+        Run standardize_single_address for several rows at once and return the results in input order
+        
+        Each row is an independent network round-trip (AI call plus rate-limited geocoding), so rows run
+        on a pool capped by PROMPT_CONFIG['max_parallel_batches'] instead of one after another.
+        """
+        if not addresses:
+            return []
+        try:
+            from app.config.address_config import PROMPT_CONFIG
+            max_parallel = PROMPT_CONFIG.get("max_parallel_batches", 5)
+        except ImportError:
+            max_parallel = 5
+        countries = countries or [None] * len(addresses)
+        row_indices = list(row_indices)
+        
+        # Empty rows are marked skipped up front instead of each taking a trip through the pool
+        valid_mask = self._valid_address_mask(addresses)
+        if not all(valid_mask):
+            valid_positions = [i for i, is_valid in enumerate(valid_mask) if is_valid]
+            results = [self._empty_address_result() for _ in addresses]
+            valid_results = self._standardize_rows_concurrently(
+                [addresses[i] for i in valid_positions],
+                [row_indices[i] for i in valid_positions],
+                [countries[i] for i in valid_positions],
+                use_free_apis
+            )
+            for i, result in zip(valid_positions, valid_results):
+                results[i] = result
+            return results
+        
+        # Repeated (address, country) pairs are standardized once and copied to the other rows
+        unique_positions, row_to_unique = self._unique_address_positions(addresses, countries)
+        total = len(unique_positions)
+        unique_results = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, total))) as executor:
+            start = last_report = time.monotonic()
+            for result in executor.map(
+                self.standardize_single_address,
+                [addresses[i] for i in unique_positions],
+                [row_indices[i] for i in unique_positions],
+                [countries[i] for i in unique_positions],
+                [use_free_apis] * total
+            ):
+                unique_results.append(result)
+                
+                # Time-gated progress with ETA, so long runs report regularly and short ones stay quiet
+                now = time.monotonic()
+                if self.show_progress and now - last_report >= PROGRESS_MIN_INTERVAL and len(unique_results) < total:
+                    last_report = now
+                    done = len(unique_results)
+                    eta = (now - start) / done * (total - done)
+                    print(f"Progress: {done}/{total} ({done/total*100:.1f}%) - ETA {eta:.0f}s")
+        return self._broadcast_unique_results(unique_results, unique_positions, row_to_unique)
+    
+    def _unique_address_positions(self, addresses: List[Any], countries: List[str]):
+        """
+        Group rows that would make identical API calls
+        
+        Returns the position of the first row for each distinct (normalized address, country) pair
+        and, for every row, the index of its pair in that list. Empty addresses are never grouped.
+        """
+        unique_positions = []
+        row_to_unique = []
+        first_seen = {}
+        for i, (address, country, is_valid) in enumerate(zip(addresses, countries, self._valid_address_mask(addresses))):
+            if not is_valid:
+                key = ('', i)
+            else:
+                key = (self._norm(str(address)), country)
+            if key not in first_seen:
+                first_seen[key] = len(unique_positions)
+                unique_positions.append(i)
+            row_to_unique.append(first_seen[key])
+        return unique_positions, row_to_unique
+    
+    @staticmethod
+    def _broadcast_unique_results(unique_results: List[Dict[str, Any]], unique_positions: List[int], row_to_unique: List[int]) -> List[Dict[str, Any]]:
+        """Expand per-unique-address results back to one result per row; repeats get their own copy"""
+        results = []
+        for i, u in enumerate(row_to_unique):
+            result = unique_results[u]
+            if result is not None and unique_positions[u] != i:
+                result = dict(result)
+            results.append(result)
+        return results
+    
+    def _assign_result_columns(self, df: pd.DataFrame, base_col_name: str, results: List[Dict[str, Any]], column_suffixes) -> None:
+        """Write standardization results into the output columns with one bulk assignment per column
         
+        results must be aligned with the rows of df; a None entry leaves that row's columns empty.
+        Error/skipped results only contribute their non-empty fields.
+        """
+        def field(result, key):
+            if result is None:
+                return ''
+            if result.get('status') == 'success':
+                return result.get(key, '')
+            return result.get(key) or ''
+        
+        columns = {}
+        for suffix in column_suffixes:
+            key = 'formatted_address' if suffix == 'formatted' else suffix
+            columns[f"{base_col_name}_{suffix}"] = [field(result, key) for result in results]
+        columns[f"{base_col_name}_from_cache"] = ['' if result is None else ('Yes' if result.get('from_cache', False) else 'No') for result in results]
+        
+        # One block insert for all result columns instead of one DataFrame insert per column
+        df[list(columns)] = pd.DataFrame(columns, index=df.index, dtype=RESULT_COLUMN_DTYPE)
+    
+    def _resolve_output_path(self, output_file: str = None) -> str:
+        """Default to a timestamped file in the outbound directory; bare file names also go there"""
         # Generate output filename if not provided
         if not output_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -2103,19 +2523,115 @@ class CSVAddressProcessor:
         output_path = Path(output_file)
         if not output_path.is_absolute() and output_path.parent == Path('.'):
             output_file = str(self.outbound_dir / output_path.name)
+        return output_file
+    
+    def _batch_api_addresses(self, df: pd.DataFrame, address_column: str = None, address_columns: List[str] = None):
+        """
+        Pick the address column of an input file for the Azure OpenAI Batch API and list what to send
         
-        # Save results with proper CSV escaping to handle commas in addresses
-        # Always use UTF-8 with BOM to properly handle Unicode characters (accented letters, etc.)
-        # UTF-8 BOM ensures Excel and other tools correctly interpret the encoding
-        try:
-            df.to_csv(output_file, index=False, encoding='utf-8-sig', quoting=1)  # utf-8-sig adds BOM
-            print(f"✅ File saved with UTF-8 encoding (supports all Unicode characters)")
-        except Exception as e:
-            # Log the error but don't fallback to latin-1 as it corrupts Unicode characters
-            print(f"⚠️ Error saving file with UTF-8: {e}")
-            # Retry with standard UTF-8 without BOM as a fallback
-            df.to_csv(output_file, index=False, encoding='utf-8', quoting=1)
-            print(f"✅ File saved with UTF-8 encoding (no BOM)")
+        Returns (address column name, addresses of every row, unique positions, row_to_unique, request positions):
+        request positions are the unique non-empty addresses, in the order they are written as requests.
+        Export and import call this on the same file and options, so both sides see the same list.
+        """
+        if address_columns:
+            missing_columns = [col for col in address_columns if col not in df.columns]
+            if missing_columns:
+                raise ValueError(f"Missing columns: {', '.join(missing_columns)}")
+            df['Combined_Address'] = self.combine_address_columns_vectorized(df, address_columns)
+            address_column = 'Combined_Address'
+        elif address_column:
+            if address_column not in df.columns:
+                raise ValueError(f"Specified address column '{address_column}' not found in CSV")
+        else:
+            detected = self.detect_address_columns(df)
+            if not detected:
+                raise ValueError("No address columns detected. Please specify the address column manually.")
+            address_column = detected[0]
+        
+        addresses = df[address_column].tolist()
+        unique_positions, row_to_unique = self._unique_address_positions(addresses, [None] * len(addresses))
+        valid = self._valid_address_mask(addresses)
+        request_positions = [i for i in unique_positions if valid[i]]
+        return address_column, addresses, unique_positions, row_to_unique, request_positions
+    
+    def export_batch_api_requests(self, input_file: str, requests_file: str, address_column: str = None,
+                                  address_columns: List[str] = None, target_country: str = None) -> int:
+        """
+        Write the Azure OpenAI Batch API input (JSONL) for a CSV or Excel file instead of calling the live API
+        
+        Batch jobs are billed at a discount and do not count against the live per-minute quota; upload the
+        file with purpose "batch", then pass the job's output file to import_batch_api_results.
+        
+        Returns:
+            Number of requests written
+        """
+        df = self._load_input_file(input_file, os.path.splitext(input_file)[1].lower())
+        address_column, addresses, _, _, request_positions = self._batch_api_addresses(df, address_column, address_columns)
+        print(f"📦 Exporting {len(request_positions)} unique addresses from '{address_column}' for the Batch API")
+        return write_batch_api_requests([str(addresses[i]).strip() for i in request_positions], requests_file, target_country)
+    
+    def import_batch_api_results(self, input_file: str, results_file: str, output_file: str = None, address_column: str = None,
+                                 address_columns: List[str] = None, target_country: str = None) -> str:
+        """
+        Merge an Azure OpenAI Batch API output file back into the input file it was exported from
+        
+        input_file and the column options must be the same as for export_batch_api_requests. The output
+        has the same standardized columns as process_csv_file (without free-API enhancement).
+        
+        Returns:
+            Path to the output file
+        """
+        df = self._load_input_file(input_file, os.path.splitext(input_file)[1].lower())
+        address_column, addresses, unique_positions, row_to_unique, request_positions = self._batch_api_addresses(df, address_column, address_columns)
+        request_addresses = [str(addresses[i]).strip() for i in request_positions]
+        ai_results = read_batch_api_results(results_file, request_addresses, target_country)
+        
+        converted = {
+            position: self._convert_batch_result(result, address, False)
+            for position, address, result in zip(request_positions, request_addresses, ai_results)
+        }
+        unique_results = [converted.get(position) or self._empty_address_result() for position in unique_positions]
+        all_results = self._broadcast_unique_results(unique_results, unique_positions, row_to_unique)
+        # Same column names as the live process_user_specified_columns / process_regular_address_format paths
+        base_col_name = "Standardized_Address" if address_columns else f"{address_column}_standardized"
+        self._assign_result_columns(df, base_col_name, all_results, RESULT_COLUMN_SUFFIXES)
+        
+        success_count = sum(1 for result in all_results if result.get('status') == 'success')
+        return self.save_and_summarize_results(
+            df, output_file, len(all_results), success_count, len(all_results) - success_count, [address_column]
+        )
+    
+    def save_and_summarize_results(self, df: pd.DataFrame, output_file: str, processed_count: int, success_count: int, error_count: int, address_columns: List[str]) -> str:
+        """Save results and display summary"""
+        
+        output_file = self._resolve_output_path(output_file)
+        
+        # Large runs can be written as Parquet (columnar, compressed) or gzip CSV based on the extension
+        output_lower = output_file.lower()
+        if output_lower.endswith('.parquet'):
+            try:
+                df.to_parquet(output_file, engine='pyarrow', compression='snappy', index=False)
+                print(f"✅ File saved as Parquet (snappy compression)")
+            except ImportError as e:
+                print(f"⚠️ Parquet output not available ({e}), saving as CSV instead")
+                output_file = str(Path(output_file).with_suffix('.csv'))
+                output_lower = output_file.lower()
+        
+        if not output_lower.endswith('.parquet'):
+            compression = 'gzip' if output_lower.endswith('.gz') else None
+            
+            # Save results with proper CSV escaping to handle commas in addresses
+            # Always use UTF-8 with BOM to properly handle Unicode characters (accented letters, etc.)
+            # UTF-8 BOM ensures Excel and other tools correctly interpret the encoding
+            try:
+                df.to_csv(output_file, index=False, encoding='utf-8-sig', quoting=1, compression=compression)  # utf-8-sig adds BOM
+                print(f"✅ File saved with UTF-8 encoding (supports all Unicode characters)")
+            except Exception as e:
+                # Log the error but don't fallback to latin-1 as it corrupts Unicode characters
+                print(f"⚠️ Error saving file with UTF-8: {e}")
+                # Retry with standard UTF-8 without BOM as a fallback
+                df.to_csv(output_file, index=False, encoding='utf-8', quoting=1, compression=compression)
+                print(f"✅ File saved with UTF-8 encoding (no BOM)")
         
         # Print summary
         print(f"\n{'='*60}")
@@ -2130,29 +2646,41 @@ class CSVAddressProcessor:
         
         return output_file
 
-    def geocode_with_nominatim(self, address: str) -> Dict[str, Any]:
+    def _throttle(self, api: str):
+        """Wait until the given free API may be called again, then reserve the next slot
+        
+        Limiters are keyed by host, so a self-hosted Nominatim does not share the public one's budget.
+        """
+        config = self.free_apis[api]
+        get_rate_limiter(urlparse(config['base_url']).netloc or api).acquire(config['rate_limit'])
+    
+    def geocode_with_nominatim(self, address: str, session: requests.Session = None) -> Dict[str, Any]:
         """Geocode using OpenStreetMap Nominatim (free, no API key required)"""
+        return self._nominatim_search({'q': address}, address, session)
+    
+    def geocode_with_nominatim_structured(self, query: Dict[str, str], session: requests.Session = None) -> Dict[str, Any]:
+        """Geocode using Nominatim's structured search (street/city/state/postalcode/country in one request)"""
+        return self._nominatim_search(dict(query), ', '.join(query.values()), session)
+    
+    def _nominatim_search(self, query_params: Dict[str, str], description: str, session: requests.Session = None) -> Dict[str, Any]:
+        """Run a Nominatim /search request and map the first hit to our component names"""
+        session = session or self._http
         try:
             params = {
-                'q': address,
+                **query_params,
                 'format': 'json',
                 'addressdetails': 1,
                 'limit': 1
             }
             
-            headers = {
-                'User-Agent': 'AddressIQ-Processor/1.0 (contact@addressiq.com)'
-            }
-            
-            response = requests.get(
+            response = session.get(
                 self.free_apis['nominatim']['base_url'],
                 params=params,
-                headers=headers,
-                timeout=10
+                timeout=(3.05, 10)
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads_json_response(response)
                 
                 if data and len(data) > 0:
                     result = data[0]
@@ -2176,27 +2704,31 @@ class CSVAddressProcessor:
                         'confidence': 'medium'
                     }
             
-            return {'success': False, 'error': f'No results found for: {address}'}
+                return {'success': False, 'error': f'No results found for: {description}'}
+            
+            # Quota, blocking and server errors are not an empty result and must not be cached as one
+            return {'success': False, 'error': f'Nominatim API error: HTTP {response.status_code}'}
             
         except Exception as e:
             return {'success': False, 'error': f'Nominatim API error: {str(e)}'}
     
-    def geocode_with_geocodify(self, address: str) -> Dict[str, Any]:
+    def geocode_with_geocodify(self, address: str, session: requests.Session = None) -> Dict[str, Any]:
         """Geocode using Geocodify API (free tier available)"""
+        session = session or self._http
         try:
             params = {
                 'api_key': 'demo',  # Free demo key with limitations
                 'q': address
             }
             
-            response = requests.get(
+            response = session.get(
                 self.free_apis['geocodify']['base_url'],
                 params=params,
-                timeout=10
+                timeout=(3.05, 10)
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads_json_response(response)
                 if data.get('response', {}).get('features'):
                     result = data['response']['features'][0]
                     properties = result.get('properties', {})
@@ -2222,93 +2754,235 @@ class CSVAddressProcessor:
                         'confidence': 'medium'
                     }
             
-            return {'success': False, 'error': f'No results found for: {address}'}
+                return {'success': False, 'error': f'No results found for: {address}'}
+            
+            # Quota, blocking and server errors are not an empty result and must not be cached as one
+            return {'success': False, 'error': f'Geocodify API error: HTTP {response.status_code}'}
             
         except Exception as e:
             return {'success': False, 'error': f'Geocodify API error: {str(e)}'}
     
-    def create_simplified_address_for_geocoding(self, current_result: Dict[str, Any]) -> List[str]:
-        """Create simplified address variants for better geocoding success"""
+    def create_simplified_address_for_geocoding(self, current_result: Dict[str, Any], needed: set = None) -> List[str]:
+        """
+        Create simplified address variants for better geocoding success
+        
+        If needed (missing components, plus 'coordinates') is given, variants that cannot return
+        any of them are left out - e.g. a postal-code-only query never yields a street number.
+        """
         simplified_addresses = []
         
-        # Extract basic components - handle None values safely
-        street_number = (current_result.get('street_number') or '').strip() if current_result.get('street_number') else ''
-        street_name = (current_result.get('street_name') or '').strip() if current_result.get('street_name') else ''
-        street_type = (current_result.get('street_type') or '').strip() if current_result.get('street_type') else ''
-        city = (current_result.get('city') or '').strip() if current_result.get('city') else ''
-        state = (current_result.get('state') or '').strip() if current_result.get('state') else ''
-        postal_code = (current_result.get('postal_code') or '').strip() if current_result.get('postal_code') else ''
-        country = (current_result.get('country') or '').strip() if current_result.get('country') else ''
+        def can_help(yields):
+            return needed is None or bool(needed & yields)
+        
+        # Extract the components the variants use in one pass - None/missing become ''
+        street_number, street_name, street_type, city, postal_code = [
+            (current_result.get(field) or '').strip()
+            for field in ('street_number', 'street_name', 'street_type', 'city', 'postal_code')
+        ]
         
         # Strategy 1: Basic street address + city + postal code (most likely to work)
-        if street_name and city and postal_code:
-            basic_parts = []
-            if street_number:
-                basic_parts.append(street_number)
-            basic_parts.append(street_name)
-            if street_type:
-                basic_parts.append(street_type)
-            basic_parts.extend([city, postal_code])
-            simplified_addresses.append(' '.join(basic_parts))
-        
-        # Strategy 2: Just city + postal code (fallback for area coordinates)
-        if city and postal_code:
-            simplified_addresses.append(f"{city} {postal_code}")
-        
-        # Strategy 3: Just postal code (minimal fallback)
-        if postal_code:
+        if street_name and city and postal_code and can_help(STREET_LEVEL_GEOCODE_YIELDS):
+            simplified_addresses.append(' '.join(part for part in (street_number, street_name, street_type, city, postal_code) if part))
+        
+        if postal_code and can_help(AREA_LEVEL_GEOCODE_YIELDS):
+            # Strategy 2: Just city + postal code (fallback for area coordinates)
+            if city:
+                simplified_addresses.append(f"{city} {postal_code}")
+            
+            # Strategy 3: Just postal code (minimal fallback)
             simplified_addresses.append(postal_code)
         
-        return simplified_addresses
+        # Drop variants that collapse to the same normalized string (order preserved)
+        unique_addresses = {}
+        for addr in simplified_addresses:
+            unique_addresses.setdefault(self._norm(addr), addr)
+        return list(unique_addresses.values())
 
-    def fill_missing_components_with_free_apis(self, address: str, current_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Try to fill missing address components using free APIs with simplified address strategy"""
+    def _geocode_cached(self, api: str, address) -> Dict[str, Any]:
+        """
+        Geocode with the given free API, reusing earlier results for the same address (compared by _canonical_key)
         
-        # Check if we need to fill missing components
-        missing_components = []
-        key_components = ['street_number', 'street_name', 'city', 'state', 'postal_code']
+        For Nominatim, address may also be a structured query dict (see create_structured_query_for_geocoding).
+        Cache hits return immediately without waiting for the rate limit. Only hits and genuine
+        empty result sets are cached; transport errors and non-200 responses are retried on the next occurrence.
+        """
+        if isinstance(address, dict):
+            key = (api, tuple((field, self._canonical_key(value)) for field, value in sorted(address.items())))
+        else:
+            key = (api, self._canonical_key(address))
+        with _geocode_cache_lock:
+            cached = _geocode_cache.get(key)
+            if cached is not None:
+                _geocode_cache.move_to_end(key)
+        if cached is not None:
+            return cached
+        
+        # Then the on-disk cache from earlier runs
+        db_key = key[1] if isinstance(key[1], str) else json.dumps(key[1])
+        with _geocode_db_lock:
+            db = get_geocode_db()
+            row = db.execute(
+                'SELECT result_json FROM geocode_cache WHERE provider = ? AND query_key = ?', (api, db_key)
+            ).fetchone() if db else None
+        if row:
+            cached = loads_json(row[0])
+            with _geocode_cache_lock:
+                _geocode_cache[key] = cached
+                if len(_geocode_cache) > GEOCODE_CACHE_MAX_ENTRIES:
+                    _geocode_cache.popitem(last=False)
+            return cached
+        
+        self._throttle(api)
+        if api == 'nominatim' and isinstance(address, dict):
+            result = self.geocode_with_nominatim_structured(address)
+        elif api == 'nominatim':
+            result = self.geocode_with_nominatim(address)
+        else:
+            result = self.geocode_with_geocodify(address)
+        
+        if result.get('success') or 'API error' not in result.get('error', ''):
+            with _geocode_cache_lock:
+                _geocode_cache[key] = result
+                _geocode_cache.move_to_end(key)
+                if len(_geocode_cache) > GEOCODE_CACHE_MAX_ENTRIES:
+                    _geocode_cache.popitem(last=False)
+            with _geocode_db_lock:
+                db = get_geocode_db()
+                if db:
+                    db.execute(
+                        'INSERT OR REPLACE INTO geocode_cache (provider, query_key, result_json, cached_at) VALUES (?, ?, ?, ?)',
+                        (api, db_key, dumps_json_bytes(result, indent=False).decode('utf-8'), int(time.time()))
+                    )
+                    db.commit()
+        return result
+    
+    def _geocode_candidates_hedged(self, candidates: List[Any]) -> tuple:
+        """
+        Geocode Nominatim candidates (address strings or structured query dicts) as a staggered race
         
-        for component in key_components:
-            if not current_result.get(component, '').strip():
-                missing_components.append(component)
+        The first candidate is sent immediately; the next one is only launched while the earlier
+        ones are still pending after the hedge delay (never sooner than the Nominatim rate limit).
+        Returns (candidate, result) for the first successful result in candidate priority order,
+        or (None, None).
+        """
+        hedge_delay = max(self.free_apis['nominatim']['hedge_delay'], self.free_apis['nominatim']['rate_limit'])
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = []
+        
+        def first_success():
+            # A candidate only wins once every higher-priority candidate has failed
+            for candidate, future in zip(candidates, futures):
+                if not future.done():
+                    return None
+                result = future.result()
+                if result.get('success'):
+                    return candidate, result
+            return None
         
-        # Always try to get coordinates if they're not present
-        need_coordinates = not current_result.get('latitude', '').strip()
+        try:
+            for candidate in candidates:
+                futures.append(executor.submit(self._geocode_cached, 'nominatim', candidate))
+                wait([f for f in futures if not f.done()], timeout=hedge_delay, return_when=FIRST_COMPLETED)
+                winner = first_success()
+                if winner:
+                    return winner
+            
+            # All candidates launched - take the first success in priority order
+            for candidate, future in zip(candidates, futures):
+                result = future.result()
+                if result.get('success'):
+                    return candidate, result
+            return None, None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def create_structured_query_for_geocoding(self, current_result: Dict[str, Any]) -> Dict[str, str]:
+        """Create a Nominatim structured query so the server resolves the simplified fallbacks in one request"""
+        def component(key):
+            return (current_result.get(key) or '').strip()
+        
+        city = component('city')
+        postal_code = component('postal_code')
+        if not city and not postal_code:
+            return {}
+        
+        query = {}
+        street = ' '.join(part for part in (component('street_number'), component('street_name'), component('street_type')) if part)
+        if street and component('street_name'):
+            query['street'] = street
+        if city:
+            query['city'] = city
+        if component('state'):
+            query['state'] = component('state')
+        if postal_code:
+            query['postalcode'] = postal_code
+        if component('country'):
+            query['country'] = component('country')
+        return query
+    
+    def _add_api_source_tag(self, current_result: Dict[str, Any], tag: str):
+        """Append an enhancement tag to api_source, e.g. 'azure_openai' -> 'azure_openai_enhanced_by_nominatim'"""
+        current_result['api_source'] = '_'.join([part for part in (current_result.get('api_source'), tag) if part])
+    
+    @staticmethod
+    def _has_missing_components(result: Dict[str, Any]) -> bool:
+        """True if a result lacks coordinates or any of KEY_ADDRESS_COMPONENTS"""
+        return not (result.get('latitude') or '').strip() or any(not (result.get(component) or '').strip() for component in KEY_ADDRESS_COMPONENTS)
+    
+    def fill_missing_components_with_free_apis(self, address: str, current_result: Dict[str, Any], prefetched_future=None) -> Dict[str, Any]:
+        """
+        Try to fill missing address components using free APIs with simplified address strategy
         
-        if not missing_components and not need_coordinates:
-            return current_result  # Nothing to fill
+        prefetched_future, if given, is a speculative Nominatim lookup of the raw address that is
+        used for the full-address fallback instead of issuing a new request.
+        """
         
-        # Create simplified addresses for geocoding
-        simplified_addresses = self.create_simplified_address_for_geocoding(current_result)
+        # Check if we need to fill missing components
+        missing_components = [component for component in KEY_ADDRESS_COMPONENTS if not (current_result.get(component) or '').strip()]
         
-        # If we have parsed components, try simplified addresses first
-        if simplified_addresses:
-            for i, simplified_addr in enumerate(simplified_addresses):
-                if self.free_apis['nominatim']['enabled']:
-                    time.sleep(self.free_apis['nominatim']['rate_limit'])
-                    
-                    nominatim_result = self.geocode_with_nominatim(simplified_addr)
-                    if nominatim_result.get('success'):
-                        # Fill missing components (but keep existing ones)
-                        for component in missing_components:
-                            if nominatim_result.get(component, '').strip():
-                                current_result[component] = nominatim_result[component]
-                        
-                        # Always update coordinates if available
-                        if nominatim_result.get('latitude', '').strip():
-                            current_result['latitude'] = nominatim_result['latitude']
-                            current_result['longitude'] = nominatim_result['longitude']
-                        
-                        # Update metadata
-                        current_result['api_source'] = f"{current_result.get('api_source', '')}_enhanced_by_nominatim_simplified".strip('_')
-                        return current_result
+        # Always try to get coordinates if they're not present
+        need_coordinates = not (current_result.get('latitude') or '').strip()
+        
+        # API switches are read once per row
+        nominatim_enabled = 'nominatim' in self._enabled_providers
+        geocodify_enabled = 'geocodify' in self._enabled_providers
         
-        # Fallback: Try original full address
+        if not (missing_components or need_coordinates) or not (nominatim_enabled or geocodify_enabled):
+            return current_result  # Nothing to fill, or nothing to fill it with
         
-        if self.free_apis['nominatim']['enabled']:
-            time.sleep(self.free_apis['nominatim']['rate_limit'])
+        # Create simplified addresses for geocoding
+        needed = set(missing_components) | ({'coordinates'} if need_coordinates else set())
+        simplified_addresses = self.create_simplified_address_for_geocoding(current_result, needed) if nominatim_enabled else []
+        
+        # If we have parsed components, race one structured query (highest priority) and the simplified addresses
+        structured_query = self.create_structured_query_for_geocoding(current_result) if nominatim_enabled else {}
+        candidates = ([structured_query] if structured_query else []) + simplified_addresses
+        if candidates:
+            winner, nominatim_result = self._geocode_candidates_hedged(candidates)
+            metadata_suffix = 'nominatim_structured' if isinstance(winner, dict) else 'nominatim_simplified'
             
-            nominatim_result = self.geocode_with_nominatim(address)
+            if nominatim_result:
+                # Fill missing components (but keep existing ones)
+                for component in missing_components:
+                    if nominatim_result.get(component, '').strip():
+                        current_result[component] = nominatim_result[component]
+                
+                # Always update coordinates if available
+                if nominatim_result.get('latitude', '').strip():
+                    current_result['latitude'] = nominatim_result['latitude']
+                    current_result['longitude'] = nominatim_result['longitude']
+                
+                # Update metadata
+                self._add_api_source_tag(current_result, f"enhanced_by_{metadata_suffix}")
+                return current_result
+        
+        # Fallback: Try original full address (unless it is one of the simplified variants already tried)
+        already_tried = self._norm(address) in {self._norm(addr) for addr in simplified_addresses}
+        if nominatim_enabled and not already_tried:
+            if prefetched_future is not None and not prefetched_future.cancelled():
+                nominatim_result = prefetched_future.result()
+            else:
+                nominatim_result = self._geocode_cached('nominatim', address)
             if nominatim_result.get('success'):
                 # Fill missing components
                 for component in missing_components:
@@ -2321,18 +2995,16 @@ class CSVAddressProcessor:
                     current_result['longitude'] = nominatim_result['longitude']
                 
                 # Update metadata
-                current_result['api_source'] = f"{current_result.get('api_source', '')}_enhanced_by_nominatim".strip('_')
+                self._add_api_source_tag(current_result, 'enhanced_by_nominatim')
                 return current_result
         
         # Try Geocodify as final fallback
-        if self.free_apis['geocodify']['enabled']:
-            time.sleep(self.free_apis['geocodify']['rate_limit'])
-            
-            geocodify_result = self.geocode_with_geocodify(address)
+        if geocodify_enabled:
+            geocodify_result = self._geocode_cached('geocodify', address)
             if geocodify_result.get('success'):
-                # Fill remaining missing components
+                # Fill remaining missing components (nothing has been filled yet if we got here)
                 for component in missing_components:
-                    if not current_result.get(component, '').strip() and geocodify_result.get(component, '').strip():
+                    if geocodify_result.get(component, '').strip():
                         current_result[component] = geocodify_result[component]
                 
                 # Add coordinates if not already present
@@ -2341,7 +3013,7 @@ class CSVAddressProcessor:
                     current_result['longitude'] = geocodify_result['longitude']
                 
                 # Update metadata
-                current_result['api_source'] = f"{current_result.get('api_source', '')}_enhanced_by_geocodify".strip('_')
+                self._add_api_source_tag(current_result, 'enhanced_by_geocodify')
         
         return current_result
     
@@ -2350,65 +3022,76 @@ class CSVAddressProcessor:
         self.free_apis['nominatim']['enabled'] = nominatim
         self.free_apis['geocodify']['enabled'] = geocodify
         
-        enabled_apis = [name for name, config in self.free_apis.items() if config['enabled']]
-        print(f"📡 Configured free APIs: {', '.join(enabled_apis) if enabled_apis else 'None'}")
+        self._enabled_providers = tuple(name for name, config in self.free_apis.items() if config['enabled'])
+        print(f"📡 Configured free APIs: {', '.join(self._enabled_providers) if self._enabled_providers else 'None'}")
+    
+    def configure_nominatim(self, base_url: str, rate_limit: float = 0.0):
+        """
+        Point Nominatim lookups at another server, e.g. a self-hosted instance
+        
+        base_url is the server root or its /search endpoint. The public 1 request/second policy does
+        not apply to your own server, so by default requests are not throttled and the free-API pool
+        runs at full width.
+        """
+        base_url = base_url.rstrip('/')
+        if not base_url.endswith('/search'):
+            base_url += '/search'
+        self.free_apis['nominatim']['base_url'] = base_url
+        self.free_apis['nominatim']['rate_limit'] = rate_limit
+        print(f"📡 Nominatim endpoint: {base_url} ({f'{rate_limit}s between requests' if rate_limit > 0 else 'no rate limit'})")
     
     def test_free_apis(self):
-        """Test the free APIs with a sample address"""
+        """Test the free APIs with a sample address (report is written in one go at the end)"""
         test_address = "1600 Amphitheatre Parkway, Mountain View, CA"
-        print(f"🧪 Testing free APIs with: {test_address}")
-        print("=" * 50)
+        lines = [f"🧪 Testing free APIs with: {test_address}", "=" * 50]
+        
+        def run_throttled(api, geocode):
+            # Probes count against each API's shared rate limit like any other request
+            self._throttle(api)
+            return geocode(test_address)
         
-        if self.free_apis['nominatim']['enabled']:
-            print("Testing Nominatim...")
-            result = self.geocode_with_nominatim(test_address)
+        # The APIs are on different hosts, so both are queried at once rather than one after the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            nominatim_future = executor.submit(run_throttled, 'nominatim', self.geocode_with_nominatim) if 'nominatim' in self._enabled_providers else None
+            geocodify_future = executor.submit(run_throttled, 'geocodify', self.geocode_with_geocodify) if 'geocodify' in self._enabled_providers else None
+        
+        if nominatim_future:
+            lines.append("Testing Nominatim...")
+            result = nominatim_future.result()
             if result.get('success'):
-                print(f"✅ Nominatim: {result.get('formatted_address', 'N/A')}")
-                print(f"   Coordinates: {result.get('latitude', 'N/A')}, {result.get('longitude', 'N/A')}")
-                print(f"   Components: {result.get('street_number', '')}, {result.get('street_name', '')}, {result.get('city', '')}")
+                lines.append(f"✅ Nominatim: {result.get('formatted_address', 'N/A')}")
+                lines.append(f"   Coordinates: {result.get('latitude', 'N/A')}, {result.get('longitude', 'N/A')}")
+                lines.append(f"   Components: {result.get('street_number', '')}, {result.get('street_name', '')}, {result.get('city', '')}")
             else:
-                print(f"❌ Nominatim: {result.get('error', 'Unknown error')}")
+                lines.append(f"❌ Nominatim: {result.get('error', 'Unknown error')}")
         
-        if self.free_apis['geocodify']['enabled']:
-            print("Testing Geocodify...")
-            time.sleep(1)  # Rate limiting
-            result = self.geocode_with_geocodify(test_address)
+        if geocodify_future:
+            lines.append("Testing Geocodify...")
+            result = geocodify_future.result()
             if result.get('success'):
-                print(f"✅ Geocodify: {result.get('formatted_address', 'N/A')}")
-                print(f"   Coordinates: {result.get('latitude', 'N/A')}, {result.get('longitude', 'N/A')}")
+                lines.append(f"✅ Geocodify: {result.get('formatted_address', 'N/A')}")
+                lines.append(f"   Coordinates: {result.get('latitude', 'N/A')}, {result.get('longitude', 'N/A')}")
             else:
-                print(f"❌ Geocodify: {result.get('error', 'Unknown error')}")
+                lines.append(f"❌ Geocodify: {result.get('error', 'Unknown error')}")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
     def parse_standardized_address_to_columns(self, result: Dict[str, Any]) -> Dict[str, str]:
         """Parse standardized address result back to column structure"""
-        components = {}
-        
-        # Build street address from components
-        street_parts = []
-        if result.get('street_number') and result.get('street_number') != 'null':
-            street_parts.append(str(result['street_number']))
-        if result.get('street_name') and result.get('street_name') != 'null':
-            street_parts.append(str(result['street_name']))
-        if result.get('street_type') and result.get('street_type') != 'null':
-            street_parts.append(str(result['street_type']))
-        
-        components['street_address'] = ' '.join(street_parts) if street_parts else ''
-        
-        # Build unit information
-        unit_parts = []
-        if result.get('unit_type') and result.get('unit_type') != 'null':
-            unit_parts.append(str(result['unit_type']))
-        if result.get('unit_number') and result.get('unit_number') != 'null':
-            unit_parts.append(str(result['unit_number']))
-        
-        components['unit_info'] = ' '.join(unit_parts) if unit_parts else ''
-        
-        # Direct mappings with null checking
-        components['city'] = str(result.get('city', '')) if result.get('city') and result.get('city') != 'null' else ''
-        components['state'] = str(result.get('state', '')) if result.get('state') and result.get('state') != 'null' else ''
-        components['postal_code'] = str(result.get('postal_code', '')) if result.get('postal_code') and result.get('postal_code') != 'null' else ''
-        
-        return components
+        def clean(key):
+            # Missing and empty values become '' (the AI parsers already turn 'null' placeholders into None)
+            field_value = result.get(key)
+            return str(field_value).strip() if field_value else ''
+        
+        parsed = {
+            # Street address and unit information from their components
+            'street_address': ' '.join(part for key in STREET_ADDRESS_PARTS if (part := clean(key))),
+            'unit_info': ' '.join(part for key in UNIT_INFO_PARTS if (part := clean(key)))
+        }
+        for key in DIRECT_ADDRESS_FIELDS:
+            parsed[key] = clean(key)
+        return parsed
 
     def compare_addresses_with_openai(self, address1: str, address2: str, country: str = None) -> Dict[str, Any]:
         """
@@ -2583,8 +3266,8 @@ Return JSON with: overall_score, match_level, likely_same_address, confidence, e
         print("⚠️ Using fallback comparison method...")
         
         # Simple string similarity as fallback
-        formatted1 = std_result1.get('formatted_address', address1).lower().strip()
-        formatted2 = std_result2.get('formatted_address', address2).lower().strip()
+        formatted1 = (std_result1.get('formatted_address') or address1).lower().strip()
+        formatted2 = (std_result2.get('formatted_address') or address2).lower().strip()
         
         # Basic similarity calculation
         from difflib import SequenceMatcher
@@ -2713,9 +3396,10 @@ Return JSON with: overall_score, match_level, likely_same_address, confidence, e
                 address_pairs = []
                 row_metadata = []
                 
-                for idx, row in batch_df.iterrows():
-                    address1 = str(row[addr1_col]).strip() if pd.notna(row[addr1_col]) else ""
-                    address2 = str(row[addr2_col]).strip() if pd.notna(row[addr2_col]) else ""
+                row_columns = [addr1_col, addr2_col] + ([id_col] if id_col else [])
+                for idx, address1_value, address2_value, *id_value in batch_df[row_columns].itertuples(index=True, name=None):
+                    address1 = str(address1_value).strip() if pd.notna(address1_value) else ""
+                    address2 = str(address2_value).strip() if pd.notna(address2_value) else ""
                     
                     address_pairs.append({
                         'address1': address1,
@@ -2725,7 +3409,7 @@ Return JSON with: overall_score, match_level, likely_same_address, confidence, e
                     # Store row metadata for later
                     row_data = {'original_row_index': idx}
                     if id_col:
-                        row_data['id'] = row[id_col] if pd.notna(row[id_col]) else ''
+                        row_data['id'] = id_value[0] if pd.notna(id_value[0]) else ''
                     row_metadata.append(row_data)
                 
                 try:
@@ -2871,9 +3555,6 @@ Return JSON with: overall_score, match_level, likely_same_address, confidence, e
                 elapsed = time.time() - start_time
                 rate = processed / elapsed if elapsed > 0 else 0
                 print(f"   ✓ Processed {processed}/{total_rows} ({processed/total_rows*100:.1f}%) - {rate:.1f} comparisons/sec")
-                
-                # Brief pause between batches
-                time.sleep(0.1)
             
             # Create results DataFrame
             results_df = pd.DataFrame(results)
@@ -2916,8 +3597,67 @@ Return JSON with: overall_score, match_level, likely_same_address, confidence, e
         except Exception as e:
             raise Exception(f"Error processing CSV comparison file: {e}")
 
+# orjson (optional) serializes large result lists several times faster than the stdlib json module
+try:
+    orjson = importlib.import_module("orjson")
+except Exception:
+    orjson = None
+
+def dumps_json_bytes(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=str).encode('utf-8')
+
+def loads_json(data) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def loads_json_response(response) -> Any:
+    """Parse an HTTP response body, using orjson on the raw bytes when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def write_json_results(results, output_file: str):
+    """Write direct-input results (a list, or a generator yielding them as they are produced) to a file
+    
+    A .jsonl path gets one compact JSON object per line, written and flushed as each result
+    arrives, so results from a generator are never collected in memory. Any other path keeps
+    the indented JSON array, which needs the full list.
+    """
+    with open(output_file, 'wb') as f:
+        if output_file.lower().endswith('.jsonl'):
+            for result in results:
+                f.write(dumps_json_bytes(result, indent=False) + b'\n')
+                f.flush()
+        else:
+            f.write(dumps_json_bytes(list(results)))
+
+def write_json_result(result: Dict[str, Any], output_file: str):
+    """Write a single direct-input result: one JSON Lines record for a .jsonl path, otherwise an indented JSON object"""
+    if output_file.lower().endswith('.jsonl'):
+        write_json_results([result], output_file)
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
 def main():
     """Enhanced command line interface supporting both CSV files and direct address input"""
+    # Fast path for the most common shell-pipeline call: `--address "<one address>"` with no other options.
+    # Runs the same steps and prints the same output as the argparse path below without building the full parser.
+    if len(sys.argv) == 3 and sys.argv[1] in ('-a', '--address') and not sys.argv[2].startswith('-'):
+        processor = CSVAddressProcessor()
+        processor.setup_directories()
+        print(f"🏠 Processing single address")
+        result = processor.process_single_address_input(sys.argv[2])
+        print(f"\n📋 Result:")
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+    
+    import argparse
     parser = argparse.ArgumentParser(
         description='AddressIQ: Standardize addresses from CSV files or direct input',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2953,6 +3693,10 @@ Examples:
   
   # Different output formats
   python csv_address_processor.py --address "123 Main St" --format formatted
+
+  # Offline Azure OpenAI Batch API run: export requests, submit them as a batch job, merge the output
+  python csv_address_processor.py addresses.csv --batch-export requests.jsonl
+  python csv_address_processor.py addresses.csv --batch-import results.jsonl -o standardized.csv
         """
     )
     
@@ -2991,10 +3735,17 @@ Examples:
     )
     
     # Options for CSV processing
-    parser.add_argument('-o', '--output', help='Output file path')
+    parser.add_argument('-o', '--output', help='Output file path (.csv, .csv.gz for gzip CSV, or .parquet for large runs; .json or .jsonl for --address)')
     parser.add_argument('-c', '--column', help='Specific address column name (for CSV)')
     parser.add_argument('--address-columns', help='Comma-separated list of columns to combine into address (e.g., "address_line1,city,state,zip")')
     parser.add_argument('-b', '--batch-size', type=int, default=5, help='Batch size for processing (default: 5)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Suppress per-row and per-batch progress messages')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log full AI requests/responses (PROMPT_CONFIG debug_mode)')
+    parser.add_argument('--llm-batch-size', type=int, help='Addresses per AI standardization request (default: PROMPT_CONFIG batch_size; capped at max_batch_size because of output token limits)')
+    parser.add_argument('--batch-export', metavar='REQUESTS_JSONL', help='Write Azure OpenAI Batch API requests for the CSV file instead of calling the live API')
+    parser.add_argument('--batch-import', metavar='RESULTS_JSONL', help='Merge a Batch API output file into the CSV file it was exported from (same column and --llm-batch-size options as --batch-export)')
+    parser.add_argument('--chunk-size', type=int, help='Stream large CSV files this many rows at a time to bound memory (e.g. 10000); chunked output is CSV or .csv.gz (a .parquet or other output name is saved as .csv)')
+    parser.add_argument('--nominatim-url', help='Self-hosted Nominatim server (root or /search URL); removes the public 1 request/second limit (env: NOMINATIM_URL)')
     parser.add_argument('--enable-free-apis', action='store_true', help='Enable free API enhancement (slower, adds geocoding data)')
     parser.add_argument('--enable-split', action='store_true', help='Enable address splitting based on rules (creates additional rows for split addresses)')
     parser.add_argument('--use-gpt-split', action='store_true', help='Use GPT-based splitting instead of rule-based (requires --enable-split)')
@@ -3059,8 +3810,27 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.quiet or args.verbose:
+        # PROMPT_CONFIG is shared with app.services.azure_openai, which gates its own messages on these keys
+        from app.config.address_config import PROMPT_CONFIG
+        if args.quiet:
+            PROMPT_CONFIG["show_progress"] = False
+        if args.verbose:
+            PROMPT_CONFIG["debug_mode"] = True
+    
+    if args.llm_batch_size:
+        # PROMPT_CONFIG is shared with app.services.azure_openai, which batches the AI requests
+        from app.config.address_config import PROMPT_CONFIG
+        max_batch_size = PROMPT_CONFIG.get("max_batch_size", 10)
+        if args.llm_batch_size > max_batch_size:
+            print(f"⚠️ --llm-batch-size {args.llm_batch_size} exceeds max_batch_size {max_batch_size} (output token limit), using {max_batch_size}")
+        PROMPT_CONFIG["batch_size"] = max(1, min(args.llm_batch_size, max_batch_size))
+    
     # Create processor instance with base directory if specified
     processor = CSVAddressProcessor(base_directory=args.base_dir)
+    processor.setup_directories()
+    if args.nominatim_url:
+        processor.configure_nominatim(args.nominatim_url)
     
     # List supported database types if requested
     if args.list_db_types:
@@ -3290,7 +4060,8 @@ Examples:
                 batch_size=args.batch_size,
                 use_free_apis=args.enable_free_apis,
                 enable_split=args.enable_split,
-                use_gpt_split=args.use_gpt_split
+                use_gpt_split=args.use_gpt_split,
+                chunk_size=args.chunk_size
             )
         except Exception as e:
             print(f"❌ Error in batch processing: {e}")
@@ -3312,7 +4083,27 @@ Examples:
         print(f"📁 Processing CSV file: {args.input_file}")
         try:
             # Check if comparison mode is enabled for CSV
-            if args.compare_csv:
+            if args.batch_export:
+                processor.export_batch_api_requests(
+                    input_file=args.input_file,
+                    requests_file=args.batch_export,
+                    address_column=args.column,
+                    address_columns=args.address_columns.split(',') if args.address_columns else None,
+                    target_country=args.country
+                )
+                print(f"\n✅ Batch API requests saved to: {args.batch_export}")
+            elif args.batch_import:
+                output_file = processor.import_batch_api_results(
+                    input_file=args.input_file,
+                    results_file=args.batch_import,
+                    output_file=args.output,
+                    address_column=args.column,
+                    address_columns=args.address_columns.split(',') if args.address_columns else None,
+                    target_country=args.country
+                )
+                print(f"\n✅ Batch API results merged successfully!")
+                print(f"📁 Output saved to: {output_file}")
+            elif args.compare_csv:
                 output_file = processor.process_csv_comparison_file(
                     input_file=args.input_file,
                     output_file=args.output,
@@ -3329,7 +4120,8 @@ Examples:
                     batch_size=args.batch_size,
                     use_free_apis=args.enable_free_apis,
                     enable_split=args.enable_split,
-                    use_gpt_split=args.use_gpt_split
+                    use_gpt_split=args.use_gpt_split,
+                    chunk_size=args.chunk_size
                 )
                 print(f"\n✅ Processing completed successfully!")
                 print(f"📁 Output saved to: {output_file}")
@@ -3417,26 +4209,26 @@ Examples:
                     print(f"✂️  Address split into {len(split_addresses)} addresses")
                     print(f"   Reason: {reason}")
                     
-                    # Process each split address
-                    results = []
-                    for idx, split_addr in enumerate(split_addresses, 1):
-                        print(f"\n   Processing split address {idx}/{len(split_addresses)}: {split_addr}")
-                        result = processor.process_single_address_input(
-                            split_addr, 
-                            args.country, 
-                            args.format
-                        )
-                        result['split_indicator'] = 'Yes'
-                        result['split_address_number'] = f"{idx} of {len(split_addresses)}"
-                        result['split_reason'] = reason
-                        results.append(result)
+                    # Process each split address (yielded one at a time so a .jsonl output is written as they finish)
+                    def process_split_addresses():
+                        for idx, split_addr in enumerate(split_addresses, 1):
+                            print(f"\n   Processing split address {idx}/{len(split_addresses)}: {split_addr}")
+                            result = processor.process_single_address_input(
+                                split_addr, 
+                                args.country, 
+                                args.format
+                            )
+                            result['split_indicator'] = 'Yes'
+                            result['split_address_number'] = f"{idx} of {len(split_addresses)}"
+                            result['split_reason'] = reason
+                            yield result
                     
                     if args.output:
-                        # Save to JSON file
-                        with open(args.output, 'w', encoding='utf-8') as f:
-                            json.dump(results, f, indent=2, ensure_ascii=False)
+                        # Save to JSON (or JSON Lines) file
+                        write_json_results(process_split_addresses(), args.output)
                         print(f"\n📄 Results saved to: {args.output}")
                     else:
+                        results = list(process_split_addresses())
                         # Print to console
                         print(f"\n📋 Results ({len(results)} addresses):")
                         for i, res in enumerate(results, 1):
@@ -3457,8 +4249,7 @@ Examples:
                     )
                     
                     if args.output:
-                        with open(args.output, 'w', encoding='utf-8') as f:
-                            json.dump(result, f, indent=2, ensure_ascii=False)
+                        write_json_result(result, args.output)
                         print(f"\n📄 Result saved to: {args.output}")
                     else:
                         print(f"\n📋 Result:")
@@ -3479,9 +4270,8 @@ Examples:
                 )
                 
                 if args.output:
-                    # Save to JSON file
-                    with open(args.output, 'w', encoding='utf-8') as f:
-                        json.dump(result, f, indent=2, ensure_ascii=False)
+                    # Save to JSON (or JSON Lines) file
+                    write_json_result(result, args.output)
                     print(f"\n📄 Result saved to: {args.output}")
                 else:
                     # Print to console
@@ -3504,9 +4294,8 @@ Examples:
             )
             
             if args.output:
-                # Save to JSON file
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+                # Save to JSON (or JSON Lines) file
+                write_json_results(results, args.output)
                 print(f"\n📄 Results saved to: {args.output}")
             else:
                 # Print to console
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Tests for the geocode cache key and cache writes, AI result conversion, Batch API files and chunked CSV processing
+
+Run with: python -m unittest test_address_processing
+"""
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import csv_address_processor
+from csv_address_processor import CSVAddressProcessor
+from app.services.azure_openai import _clear_null_strings
+
+
+class CanonicalKeyTests(unittest.TestCase):
+    key = staticmethod(CSVAddressProcessor._canonical_key)
+
+    def test_spelling_variants_share_a_key(self):
+        self.assertEqual(self.key('100 Main St.'), self.key('100 MAIN STREET'))
+        self.assertEqual(self.key('5 Oak Ave, Apt 2'), self.key('5 oak avenue, apartment 2'))
+
+    def test_street_type_expanded_in_street_position(self):
+        self.assertEqual(self.key('100 Main St, Hartford, CT 06103'), '100 main street hartford ct 06103')
+        self.assertEqual(self.key('100 N Main St NE'), '100 north main street northeast')
+
+    def test_saint_is_not_expanded(self):
+        self.assertEqual(self.key('St Louis, MO'), 'st louis mo')
+
+    def test_state_codes_are_not_expanded(self):
+        self.assertEqual(self.key('1 Elm Rd, Miami, FL 33101'), '1 elm road miami fl 33101')
+        self.assertNotEqual(self.key('1 Elm Rd, Hartford, CT'), self.key('1 Elm Rd, Hartford, Court'))
+
+
+class ConvertBatchResultTests(unittest.TestCase):
+    def setUp(self):
+        base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, base, True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.processor = CSVAddressProcessor(base_directory=base)
+
+    def test_null_placeholders_become_empty_defaults(self):
+        raw = _clear_null_strings({'formatted_address': 'null', 'confidence': 'None', 'city': ''})
+        self.assertEqual(raw, {'formatted_address': None, 'confidence': None, 'city': None})
+
+        result = self.processor._convert_batch_result(raw, '1 Main St', False)
+        self.assertEqual(result['formatted_address'], '')
+        self.assertEqual(result['confidence'], 'unknown')
+        self.assertEqual(result['status'], 'success')
+
+    def test_real_values_are_kept(self):
+        raw = _clear_null_strings({'formatted_address': '1 MAIN ST', 'confidence': 'high'})
+        result = self.processor._convert_batch_result(raw, '1 main st', True)
+        self.assertEqual(result['formatted_address'], '1 MAIN ST')
+        self.assertEqual(result['confidence'], 'high')
+        self.assertTrue(result['from_cache'])
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        return self.response
+
+
+class GeocodeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self._saved = (csv_address_processor.GEOCODE_CACHE_DB_PATH, csv_address_processor._geocode_db)
+        csv_address_processor.GEOCODE_CACHE_DB_PATH = os.path.join(self.base, 'geocache.db')
+        csv_address_processor._geocode_db = None
+        csv_address_processor._geocode_cache.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.processor = CSVAddressProcessor(base_directory=self.base)
+        for config in self.processor.free_apis.values():
+            config['rate_limit'] = 0
+
+    def tearDown(self):
+        if csv_address_processor._geocode_db is not None:
+            csv_address_processor._geocode_db.close()
+        csv_address_processor.GEOCODE_CACHE_DB_PATH, csv_address_processor._geocode_db = self._saved
+        csv_address_processor._geocode_cache.clear()
+
+    def _stored_rows(self):
+        with csv_address_processor._geocode_db_lock:
+            db = csv_address_processor.get_geocode_db()
+            return db.execute('SELECT provider, query_key FROM geocode_cache').fetchall()
+
+    def test_http_errors_are_not_cached(self):
+        for api in ('geocodify', 'nominatim'):
+            session = _FakeSession(_FakeResponse(403, {}))
+            self.processor._http = session
+            first = self.processor._geocode_cached(api, '1 Main St')
+            self.processor._geocode_cached(api, '1 Main St')
+            self.assertIn('API error: HTTP 403', first['error'])
+            self.assertEqual(session.calls, 2)
+        self.assertEqual(self._stored_rows(), [])
+
+    def test_empty_result_sets_are_cached(self):
+        session = _FakeSession(_FakeResponse(200, []))
+        self.processor._http = session
+        first = self.processor._geocode_cached('nominatim', '1 Main St')
+        self.processor._geocode_cached('nominatim', '1 Main St')
+        self.assertTrue(first['error'].startswith('No results found'))
+        self.assertEqual(session.calls, 1)
+        self.assertEqual(self._stored_rows(), [('nominatim', '1 main street')])
+
+
+class BatchApiRoundTripTests(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.input_file = os.path.join(self.base, 'addresses.csv')
+        with open(self.input_file, 'w', encoding='utf-8') as f:
+            f.write('id,address\n1,1 Main St\n2,\n3,2 Oak Ave\n4,1 main st\n')
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.processor = CSVAddressProcessor(base_directory=self.base)
+
+    def _answer_requests(self, requests_file, results_file):
+        """Fake Batch API job: answer each request with its addresses upper-cased"""
+        with open(requests_file, encoding='utf-8') as f:
+            requests = [json.loads(line) for line in f]
+        with open(results_file, 'w', encoding='utf-8') as f:
+            f.write('not json\n')
+            for request in requests:
+                numbered = request['body']['messages'][1]['content'].splitlines()
+                answers = []
+                for line in numbered:
+                    index, address = line.split(': ', 1)
+                    answers.append({'input_index': int(index), 'formatted_address': address.upper(), 'confidence': 'high'})
+                response = {'status_code': 200, 'body': {'choices': [{'message': {'content': json.dumps(answers)}}]}}
+                f.write(json.dumps({'custom_id': request['custom_id'], 'response': response}) + '\n')
+
+    def test_export_then_import_fills_every_row(self):
+        requests_file = os.path.join(self.base, 'requests.jsonl')
+        results_file = os.path.join(self.base, 'results.jsonl')
+        with contextlib.redirect_stdout(io.StringIO()):
+            request_count = self.processor.export_batch_api_requests(self.input_file, requests_file, address_column='address')
+            self._answer_requests(requests_file, results_file)
+            output_file = self.processor.import_batch_api_results(
+                self.input_file, results_file, os.path.join(self.base, 'out.csv'), address_column='address'
+            )
+        self.assertEqual(request_count, 1)
+
+        import pandas as pd
+        output = pd.read_csv(output_file, dtype=str, keep_default_na=False)
+        self.assertEqual(output['address_standardized_formatted'].tolist(), ['1 MAIN ST', '', '2 OAK AVE', '1 MAIN ST'])
+        self.assertEqual(output['address_standardized_status'].tolist(), ['success', 'skipped', 'success', 'success'])
+
+
+class ChunkedProcessingTests(unittest.TestCase):
+    def setUp(self):
+        self._db_path = csv_address_processor.GEOCODE_CACHE_DB_PATH
+        csv_address_processor.GEOCODE_CACHE_DB_PATH = None
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.input_file = os.path.join(self.base, 'addresses.csv')
+        with open(self.input_file, 'w', encoding='utf-8') as f:
+            f.write('location,zip,ts,n,blank\n')
+            for i in range(23):
+                f.write(f'{i} Main st,0{i}234,2024-01-05T10:00:{i:02d},{i}.50,{"" if i % 3 else "NA"}\n')
+
+    def tearDown(self):
+        csv_address_processor.GEOCODE_CACHE_DB_PATH = self._db_path
+
+    def _run(self, chunk_size, name):
+        def fake_batch(addresses, start_index, target_country=None, use_free_apis=False):
+            return [{'status': 'success', 'formatted_address': str(a).upper(), 'from_cache': False} for a in addresses]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            processor = CSVAddressProcessor(base_directory=self.base)
+            processor.standardize_addresses_batch = fake_batch
+            processor.archive_single_inbound_file = lambda path: None
+            output_file = processor.process_csv_file(
+                self.input_file, os.path.join(self.base, name),
+                address_column='location', chunk_size=chunk_size
+            )
+        with open(output_file, 'rb') as f:
+            return f.read()
+
+    def test_chunked_output_matches_whole_file_output(self):
+        whole = self._run(None, 'whole.csv')
+        chunked = self._run(5, 'chunked.csv')
+        self.assertEqual(whole, chunked)
+
+    def test_values_are_preserved_as_text(self):
+        row = self._run(5, 'chunked.csv').decode('utf-8-sig').splitlines()[1]
+        self.assertTrue(row.startswith('"0 Main st","00234","2024-01-05T10:00:00","0.50","","0 MAIN ST"'), row)
+
+
+if __name__ == '__main__':
+    unittest.main()
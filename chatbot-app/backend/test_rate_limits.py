@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the free-API RateLimiter and the AI RequestBudget
+
+Run with: python -m unittest test_rate_limits
+"""
+import threading
+import time
+import unittest
+
+from csv_address_processor import RateLimiter, get_rate_limiter
+from app.services.azure_openai import RequestBudget
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_first_call_does_not_wait(self):
+        limiter = RateLimiter()
+        start = time.monotonic()
+        limiter.acquire(0.5)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_calls_are_spaced_by_the_interval(self):
+        limiter = RateLimiter()
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire(0.1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_slow_callers_are_not_delayed(self):
+        limiter = RateLimiter()
+        limiter.acquire(0.05)
+        time.sleep(0.1)
+        start = time.monotonic()
+        limiter.acquire(0.05)
+        self.assertLess(time.monotonic() - start, 0.03)
+
+    def test_threads_share_the_interval(self):
+        limiter = RateLimiter()
+        call_times = []
+        lock = threading.Lock()
+
+        def call():
+            limiter.acquire(0.05)
+            with lock:
+                call_times.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        call_times.sort()
+        gaps = [later - earlier for earlier, later in zip(call_times, call_times[1:])]
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
+
+    def test_one_limiter_per_api(self):
+        self.assertIs(get_rate_limiter('nominatim'), get_rate_limiter('nominatim'))
+        self.assertIsNot(get_rate_limiter('nominatim'), get_rate_limiter('geocodify'))
+
+
+class RequestBudgetTests(unittest.TestCase):
+    def test_zero_limits_never_block_or_record(self):
+        budget = RequestBudget(0, 0)
+        start = time.monotonic()
+        for _ in range(100):
+            budget.acquire(1000)
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(len(budget._sent), 0)
+
+    def test_request_limit_waits_for_the_window(self):
+        budget = RequestBudget(2, 0, window=0.2)
+        start = time.monotonic()
+        budget.acquire(1)
+        budget.acquire(1)
+        self.assertLess(time.monotonic() - start, 0.1)
+        budget.acquire(1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_token_limit_waits_for_the_window(self):
+        budget = RequestBudget(0, 100, window=0.2)
+        start = time.monotonic()
+        budget.acquire(60)
+        budget.acquire(60)
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_oversized_request_passes_on_an_empty_window(self):
+        budget = RequestBudget(0, 100, window=0.2)
+        start = time.monotonic()
+        budget.acquire(500)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_pause_holds_back_callers(self):
+        budget = RequestBudget(0, 0)
+        budget.pause(0.15)
+        start = time.monotonic()
+        budget.acquire(1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.14)
+
+
+if __name__ == '__main__':
+    unittest.main()